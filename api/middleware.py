@@ -0,0 +1,58 @@
+"""
+ASGI middleware for TalentScout AI API
+Lightweight pure-ASGI middleware without Request/Response wrapping
+"""
+
+from typing import List
+
+
+class FastCORSMiddleware:
+    """Permissive CORS middleware operating directly on ASGI messages"""
+
+    def __init__(self, app, origins: List[str] = None, allow_credentials: bool = True):
+        self.app = app
+        self.origins = [origin.encode("latin-1") for origin in (origins or ["*"])]
+        self.allow_all_origins = b"*" in self.origins
+
+        # Everything except the echoed origin is constant, so build it once
+        self.simple_headers = [(b"vary", b"Origin")]
+        if allow_credentials:
+            self.simple_headers.append((b"access-control-allow-credentials", b"true"))
+        self.preflight_headers = self.simple_headers + [
+            (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+            (b"access-control-max-age", b"600"),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request_headers = dict(scope["headers"])
+        origin = request_headers.get(b"origin")
+
+        # Not a cross-origin request - nothing to add
+        if origin is None or not (self.allow_all_origins or origin in self.origins):
+            return await self.app(scope, receive, send)
+
+        # The origin is echoed rather than "*" because browsers reject a
+        # wildcard origin on credentialed requests
+        allow_origin = (b"access-control-allow-origin", origin)
+
+        # Answer preflight requests without reaching the application
+        if scope["method"] == "OPTIONS" and b"access-control-request-method" in request_headers:
+            headers = [allow_origin, *self.preflight_headers]
+            requested_headers = request_headers.get(b"access-control-request-headers")
+            if requested_headers:
+                headers.append((b"access-control-allow-headers", requested_headers))
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        simple_headers = self.simple_headers
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), allow_origin, *simple_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -1,12 +1,14 @@
 """
 API models for TalentScout AI
-Pydantic models for API request/response validation
+Pydantic models for API request validation, msgspec structs for responses
 """
 
-from pydantic import BaseModel, Field, EmailStr
-from typing import List, Dict, Any, Optional
+import msgspec
+from pydantic import BaseModel, Field, EmailStr, StringConstraints
+from typing import Annotated, List, Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
+import time
 
 class MessageRole(str, Enum):
     USER = "user"
@@ -22,10 +24,10 @@ class InterviewStage(str, Enum):
 
 class ChatMessageRequest(BaseModel):
     session_id: str = Field(..., description="Interview session ID")
-    message: str = Field(..., min_length=1, description="User message content")
+    message: Annotated[str, StringConstraints(min_length=1)] = Field(..., description="User message content")
     role: MessageRole = Field(default=MessageRole.USER, description="Message role")
 
-class ChatMessageResponse(BaseModel):
+class ChatMessageResponse(msgspec.Struct):
     session_id: str
     response: str
     stage: InterviewStage
@@ -37,31 +39,31 @@ class QuestionGenerationRequest(BaseModel):
     context: Dict[str, Any] = Field(..., description="Context for question generation")
     question_type: str = Field(default="technical", description="Type of question to generate")
 
-class QuestionGenerationResponse(BaseModel):
+class QuestionGenerationResponse(msgspec.Struct):
     question: str
     type: str
     model_used: str
     success: bool = True
 
 class CandidateProfileRequest(BaseModel):
-    name: str = Field(..., min_length=2, description="Candidate full name")
+    name: Annotated[str, StringConstraints(min_length=2)] = Field(..., description="Candidate full name")
     email: EmailStr = Field(..., description="Candidate email address")
     experience: str = Field(..., description="Years of experience")
     position: str = Field(..., description="Desired position")
-    tech_stack: List[str] = Field(..., min_items=1, description="Technical skills")
+    tech_stack: Annotated[List[str], Field(min_length=1)] = Field(..., description="Technical skills")
 
-class SessionCreateResponse(BaseModel):
+class SessionCreateResponse(msgspec.Struct):
     session_id: str
     created_at: datetime
     status: str = "active"
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(msgspec.Struct):
     error: str
     detail: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: float = msgspec.field(default_factory=time.time)
 
-class HealthCheckResponse(BaseModel):
+class HealthCheckResponse(msgspec.Struct):
     status: str = "healthy"
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: float = msgspec.field(default_factory=time.time)
     service: str = "TalentScout AI API"
     version: str = "2.0.0"
@@ -0,0 +1,19 @@
+"""
+msgspec response class for TalentScout AI API
+Fast JSON rendering for msgspec.Struct output models
+"""
+
+from typing import Any
+
+import msgspec
+from fastapi import Response
+
+
+class MsgspecResponse(Response):
+    """JSON response rendered with a shared msgspec encoder"""
+
+    media_type = "application/json"
+    _encoder = msgspec.json.Encoder()
+
+    def render(self, content: Any) -> bytes:
+        return self._encoder.encode(content)
@@ -3,33 +3,88 @@ API routes for TalentScout AI
 FastAPI-based routes for external integrations and API access
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+import msgspec
+import ormsgpack
+from cachetools import TTLCache
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+import asyncio
+import functools
+import itertools
 import json 
+import time
 from fastapi import APIRouter
 
+from .orjson_response import ORJSONResponse
+from .msgspec_response import MsgspecResponse
+
 
 router = APIRouter()
 
+# Monotonic session ID source, seeded from the current time in milliseconds
+_session_id_counter = itertools.count(int(time.time() * 1000))
+
+# ISO timestamp cache, refreshed when the wall-clock second changes
+_timestamp_cache = {"second": -1, "iso": ""}
+
+def _iso_now() -> str:
+    """Current local time as an ISO string at one-second resolution"""
+    second = int(time.time())
+    if second != _timestamp_cache["second"]:
+        _timestamp_cache["iso"] = datetime.fromtimestamp(second).isoformat()
+        _timestamp_cache["second"] = second
+    return _timestamp_cache["iso"]
+
+# Lazy module handles, resolved once on first use instead of per request
+@functools.cache
+def _ai_manager():
+    from core.ai_manager import advanced_ai_manager
+    return advanced_ai_manager
+
+@functools.cache
+def _database():
+    import database
+    return database
+
+# Short-lived read caches that collapse polling bursts for the same session.
+# Only touched from the event loop thread, so no lock is needed.
+_session_cache = TTLCache(maxsize=4096, ttl=1.0)
+_candidate_cache = TTLCache(maxsize=4096, ttl=1.0)
+
 # Request/Response Models
 class ChatMessage(BaseModel):
     session_id: str = Field(..., description="Interview session ID")
     message: str = Field(..., description="User message content")
     role: str = Field(default="user", description="Message role")
 
-class ChatResponse(BaseModel):
+class ChatResponse(msgspec.Struct):
     session_id: str
     response: str
     stage: str
     timestamp: str
 
-class InterviewSession(BaseModel):
+class InterviewSession(msgspec.Struct):
     session_id: str
     candidate_name: Optional[str] = None
     current_stage: str = "greeting"
     progress_percentage: int = 0
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    status: str = "active"
+    ai_questions_generated: int = 0
+
+def _struct_responses(struct_type) -> Dict[int, Any]:
+    """OpenAPI 200 response for an endpoint that returns a msgspec struct via MsgspecResponse
+
+    These endpoints have no response_model, so without this the docs show an
+    empty schema. The structs are flat, so the component schema is inlined.
+    """
+    _, components = msgspec.json.schema_components([struct_type])
+    schema = components[struct_type.__name__]
+    return {200: {"content": {"application/json": {"schema": schema}}}}
 
 class CandidateProfile(BaseModel):
     name: str
@@ -38,23 +93,27 @@ class CandidateProfile(BaseModel):
     position: str
     tech_stack: List[str]
 
+class CandidateRecord(CandidateProfile):
+    session_id: str
+    phone: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
 # Chat API Endpoints
-@router.post("/chat/message", response_model=ChatResponse)
+@router.post("/chat/message", responses=_struct_responses(ChatResponse))
 async def send_chat_message(message: ChatMessage):
     """Send message to AI interviewer and get response"""
     try:
-        # Process message with AI manager
-        from core.ai_manager import advanced_ai_manager
-        
         # Generate AI response based on message
         response_content = f"AI response to: {message.message}"
         
-        return ChatResponse(
+        # Return the response directly to skip jsonable_encoder and re-validation
+        return MsgspecResponse(ChatResponse(
             session_id=message.session_id,
             response=response_content,
             stage="technical_assessment",
-            timestamp=datetime.now().isoformat()
-        )
+            timestamp=_iso_now()
+        ))
         
     except Exception as e:
         raise HTTPException(
@@ -66,16 +125,14 @@ async def send_chat_message(message: ChatMessage):
 async def generate_ai_question(session_id: str, context: Dict[str, Any]):
     """Generate AI question based on context"""
     try:
-        from core.ai_manager import advanced_ai_manager
-        
-        question_result = advanced_ai_manager.generate_dynamic_question_sync(context)
+        question_result = await run_in_threadpool(_ai_manager().generate_dynamic_question_sync, context)
         
         if question_result["success"]:
-            return {
+            return ORJSONResponse({
                 "question": question_result["question"],
                 "type": question_result["type"],
                 "success": True
-            }
+            })
         else:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -89,17 +146,16 @@ async def generate_ai_question(session_id: str, context: Dict[str, Any]):
         )
 
 # Session Management Endpoints
-@router.post("/session/create", response_model=InterviewSession)
+@router.post("/session/create", responses=_struct_responses(InterviewSession))
 async def create_interview_session():
     """Create new interview session"""
     try:
-        session_id = f"session_{int(datetime.now().timestamp())}"
+        session_id = f"session_{next(_session_id_counter):x}"
         
         # Create session in database
-        from database import session_crud
-        session_crud.create_session(session_id)
+        await run_in_threadpool(_database().session_crud.create_session, session_id)
         
-        return InterviewSession(session_id=session_id)
+        return MsgspecResponse(InterviewSession(session_id=session_id))
         
     except Exception as e:
         raise HTTPException(
@@ -107,12 +163,19 @@ async def create_interview_session():
             detail=f"Failed to create session: {str(e)}"
         )
 
-@router.get("/session/{session_id}")
+@router.get("/session/{session_id}", responses=_struct_responses(InterviewSession))
 async def get_interview_session(session_id: str):
-    """Get interview session details"""
+    """Get interview session details
+
+    The struct is built straight from the row without validation on
+    purpose: it is trusted internal data from database.session_crud.
+    """
     try:
-        from database import session_crud
-        session_data = session_crud.get_session(session_id)
+        session_data = _session_cache.get(session_id)
+        if session_data is None:
+            session_data = await run_in_threadpool(_database().session_crud.get_session, session_id)
+            if session_data:
+                _session_cache[session_id] = session_data
         
         if not session_data:
             raise HTTPException(
@@ -120,7 +183,12 @@ async def get_interview_session(session_id: str):
                 detail="Session not found"
             )
         
-        return session_data
+        session = InterviewSession(**{
+            field: session_data[field]
+            for field in InterviewSession.__struct_fields__
+            if field in session_data
+        })
+        return MsgspecResponse(session)
         
     except HTTPException:
         raise
@@ -133,12 +201,21 @@ async def get_interview_session(session_id: str):
 # Candidate Management Endpoints
 @router.post("/candidate/profile")
 async def save_candidate_profile(session_id: str, profile: CandidateProfile):
-    """Save candidate profile"""
+    """Save candidate profile and record the submission event concurrently
+
+    The event only records that a profile was submitted, so it is safe to log
+    before knowing whether the save succeeded.
+    """
     try:
-        from database import candidate_crud
+        database = _database()
+        candidate_data = profile.model_dump(mode="python", exclude_unset=True)
+        event_data = {"position": profile.position, "tech_count": len(profile.tech_stack)}
         
-        candidate_data = profile.dict()
-        success = candidate_crud.create_candidate(session_id, candidate_data)
+        success, _ = await asyncio.gather(
+            run_in_threadpool(database.candidate_crud.create_candidate, session_id, candidate_data),
+            run_in_threadpool(database.analytics_crud.log_event, session_id, "candidate_profile_submitted", event_data)
+        )
+        _candidate_cache.pop(session_id, None)
         
         if success:
             return {"message": "Candidate profile saved", "success": True}
@@ -154,12 +231,19 @@ async def save_candidate_profile(session_id: str, profile: CandidateProfile):
             detail=str(e)
         )
 
-@router.get("/candidate/{session_id}")
+@router.get("/candidate/{session_id}", response_model=CandidateRecord)
 async def get_candidate_profile(session_id: str):
-    """Get candidate profile"""
+    """Get candidate profile
+
+    Uses model_construct on purpose: the row is trusted internal data
+    from database.candidate_crud, so field validation is skipped.
+    """
     try:
-        from database import candidate_crud
-        candidate = candidate_crud.get_candidate(session_id)
+        candidate = _candidate_cache.get(session_id)
+        if candidate is None:
+            candidate = await run_in_threadpool(_database().candidate_crud.get_candidate, session_id)
+            if candidate:
+                _candidate_cache[session_id] = candidate
         
         if not candidate:
             raise HTTPException(
@@ -167,7 +251,8 @@ async def get_candidate_profile(session_id: str):
                 detail="Candidate not found"
             )
         
-        return candidate
+        record = CandidateRecord.model_construct(**candidate)
+        return ORJSONResponse(record.model_dump())
         
     except HTTPException:
         raise
@@ -179,13 +264,18 @@ async def get_candidate_profile(session_id: str):
 
 # Analytics Endpoints
 @router.get("/analytics/session/{session_id}")
-async def get_session_analytics(session_id: str):
-    """Get analytics for specific session"""
+async def get_session_analytics(session_id: str, request: Request):
+    """Get analytics for specific session (msgpack if the client accepts it)"""
     try:
-        from database import analytics_crud
-        analytics = analytics_crud.get_session_analytics(session_id)
+        analytics = await run_in_threadpool(_database().analytics_crud.get_session_analytics, session_id)
+        payload = {"session_id": session_id, "analytics": analytics}
+        # The body format depends on Accept, so caches must key on it too
+        headers = {"Vary": "Accept"}
+        
+        if "application/x-msgpack" in request.headers.get("accept", ""):
+            return Response(content=ormsgpack.packb(payload), media_type="application/x-msgpack", headers=headers)
         
-        return {"session_id": session_id, "analytics": analytics}
+        return ORJSONResponse(payload, headers=headers)
         
     except Exception as e:
         raise HTTPException(
@@ -196,8 +286,8 @@ async def get_session_analytics(session_id: str):
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
+    return ORJSONResponse({
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _iso_now(),
         "service": "TalentScout AI API"
-    }
+    })
@@ -4,51 +4,314 @@ Complete implementation with smart tech-specific question generation
 """
 
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from cachetools import TTLCache
+import functools
+import hashlib
+import json
+import threading
+import time
 import re
 import random
+import unicodedata
 
+# Candidate profile fields, in the order they are collected
+REQUIRED_INFO = ('name', 'email', 'experience', 'position', 'tech_stack')
+
+# Info-collection replies keyed by the field just collected; only the one
+# returned is formatted
+FIELD_Q = {
+    'name': lambda ci: f"Nice to meet you, **{ci.get('name', 'there')}**! Could you please share your **email address**?",
+    'email': lambda ci: f"Perfect! How many **years of professional experience** do you have, {ci.get('name', '')}?",
+    'experience': lambda ci: f"Great! **{ci.get('experience', '')}** is excellent. What **type of position** are you interested in?",
+    'position': lambda ci: "Perfect! What are your main **technical skills and technologies**?\n\n*Please list all technologies you work with (e.g., Python, GenAI, LLM, React, etc.)*",
+    'tech_stack': lambda ci: "Thank you for that comprehensive information!"
+}
+
+# Fallback questions served when a candidate skips; templates are formatted
+# only for the one picked
+ALT_SINGLE_TECH_QUESTIONS = (
+    "**Basic Concepts:** What are the key features of {tech} that make it suitable for your projects?",
+    "**Problem-Solving:** How would you debug a performance issue in a {tech} application?",
+    "**Best Practices:** What coding standards do you follow when writing {tech} code?"
+)
+ALT_MULTI_TECH_QUESTIONS = (
+    "**Technology Choice:** Why would you choose {first} over other alternatives for a new project?",
+    "**Integration:** How do these technologies ({techs}) complement each other in your work?",
+    "**Learning:** Which of these technologies ({techs}) did you find most challenging to learn and why?"
+)
+ALT_BEHAVIORAL_QUESTIONS = (
+    "**Learning:** Tell me about a new skill you learned recently. How did you approach it?",
+    "**Challenges:** Describe a work challenge you faced. How did you handle it?",
+    "**Teamwork:** How do you prefer to work - independently or in a team? Why?",
+    "**Goals:** What are your career goals for the next 2-3 years?",
+    "**Motivation:** What motivates you most in your work?"
+)
+
+BEHAVIORAL_TOPICS = (
+    "Problem-Solving and Critical Thinking",
+    "Team Collaboration and Communication",
+    "Learning and Professional Development",
+    "Leadership and Initiative",
+    "Adaptability and Change Management",
+    "Time Management and Prioritization"
+)
+
+# Stage order and the message announcing each stage; wrap-up is built on demand
+STAGE_PROGRESSION = {
+    'greeting': 'info_collection',
+    'info_collection': 'technical_assessment',
+    'technical_assessment': 'behavioral_assessment',
+    'behavioral_assessment': 'wrap_up'
+}
+STAGE_BANNERS = {
+    'greeting': "👋 **Current Stage:** Initial Greeting",
+    'info_collection': "📝 **Current Stage:** Information Collection (Collected: {collected} items)",
+    'technical_assessment': "💻 **Current Stage:** Technical Assessment | {tech_mode}",
+    'behavioral_assessment': "🧠 **Current Stage:** Behavioral Assessment",
+    'wrap_up': "✅ **Current Stage:** Interview Complete"
+}
+STAGE_TRANSITION_MESSAGES = {
+    'info_collection': "📝 **Information Collection Phase**\n\nLet's gather details about your background.",
+    'technical_assessment': "💻 **Technical Assessment Phase**\n\nTime for technical questions based on your skills.",
+    'behavioral_assessment': "🧠 **Behavioral Assessment Phase**\n\nLet's explore your soft skills and work approach."
+}
+
+# Number of most recent messages rendered as chat bubbles on each rerun
+CHAT_WINDOW = 30
+ARCHIVE_SPEAKERS = {'assistant': "🤖 **Interviewer:**", 'user': "👤 **Candidate:**"}
+
+# Static chat copy, built once at import
+WELCOME_MD = """👋 **Welcome to TalentScout AI!**
+
+I'm your AI interviewer, powered by **Llama 3.3 70B**. I'll conduct a comprehensive interview by:
+
+🎯 **Smart Question Generation:**
+- **Single Tech** (e.g., "Python") → Deep Python-focused questions
+- **Multiple Tech** (e.g., "Python, GenAI, LLM") → Integration questions covering ALL technologies
+
+💻 **Adaptive Interview Flow:**
+- Auto-generates diverse questions
+- Handles skip requests intelligently  
+- Provides real-time analytics
+- Professional interview experience
+
+Click **Start Interview** when you're ready!"""
+
+GREETING_MD = """Hello! I'm your AI interviewer from TalentScout. I'll conduct a comprehensive technical interview with **intelligent question generation**.
+
+✨ **Smart Features:**
+- **Tech-Specific Questions:** Single tech = deep dive, Multiple tech = integration
+- **Auto-Generation:** Questions appear automatically based on your responses
+- **Skip-Friendly:** Say "skip" or "next" to move forward anytime
+
+Let's start with the basics. **What's your full name?**"""
+
+COMPLETION_TEMPLATE = """🎉 **Interview Successfully Completed!**
+
+Thank you for your time, **{name}**! You've completed our comprehensive AI-powered technical interview.
+
+**📊 Interview Summary:**
+- ✅ **Technology Assessment:** {tech_stack}
+- ✅ **Questions Generated:** {question_count}
+- ✅ **Duration:** {duration}
+- ✅ **Stages Completed:** All phases ✅
+
+**🎯 Key Highlights:**
+- Demonstrated technical expertise across your technology stack
+- Showed adaptability with AI-generated personalized questions
+- Maintained professional engagement throughout the process
+
+**📋 Assessment Coverage:**
+- **Technical Depth:** Advanced concepts and real-world applications
+- **Problem-Solving:** Scenario-based challenges
+- **Communication:** Clear articulation of technical concepts
+- **Professional Skills:** Behavioral competencies
+
+**🚀 Next Steps:**
+1. **Comprehensive Review:** Technical team analyzes your responses
+2. **Feedback Timeline:** You'll hear back within 24-48 hours
+3. **Potential Follow-up:** Technical deep-dive or team interviews
+4. **Decision Process:** Final decision within 3-5 business days
+
+**💡 Interview Innovations Used:**
+- AI-powered question generation
+- Technology-specific vs integration testing
+- Real-time conversation adaptation
+- Professional assessment methodology
+
+Thank you for choosing TalentScout AI - where intelligence meets talent! 🌟
+
+*Your interview data has been securely recorded for review.*"""
+
+# Profile recap shown when info collection completes; tech_label is singular or plural
+PROFILE_SUMMARY_TEMPLATE = """**📋 Complete Profile:**
+- **Name:** {name}
+- **Experience:** {experience}
+- **Position:** {position}
+- **{tech_label}:** {tech_stack}"""
+
+# Static system prompt, sent verbatim as the first message of every GROQ call
+# so providers with prefix caching can reuse it
+SYSTEM_PROMPT = """You are a professional technical interviewer. Create engaging, specific questions that test both technical knowledge and practical application. 
+
+Guidelines:
+- Be conversational and show genuine interest
+- Ask one focused question at a time
+- Make questions scenario-based and practical
+- Adapt difficulty to candidate's experience level
+- Avoid generic or textbook questions"""
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+# GROQ model per latency tier: short template-style prompts use the 8B
+# instant model, open-ended questions and summaries stay on the 70B model
+GROQ_MODELS = {
+    'instant': "llama-3.1-8b-instant",
+    'balanced': "llama-3.3-70b-versatile"
+}
+
+# Technical question prompts, formatted with the candidate's stack and experience
+SINGLE_TECH_PROMPT = """Create a focused technical question for {tech} with {experience} experience.
+
+Requirements:
+- Focus EXCLUSIVELY on {tech}
+- Test practical knowledge and real-world application
+- Include scenario-based problem solving
+- Appropriate difficulty for {experience} level
+- Avoid generic questions
+
+Format: Present a specific {tech} challenge or technical scenario."""
+
+MULTI_TECH_PROMPT = """Create a technical question that integrates {techs} for {experience} experience.
+
+Requirements:
+- Combine ALL technologies: {techs}
+- Focus on integration and how they work together
+- Real-world system design scenario
+- Test understanding of technology interactions
+- Include architecture considerations
+
+Format: Present a system integration challenge using all {tech_count} technologies."""
+
+# Per-prompt generation budgets; a single question rarely needs more than
+# ~60 tokens, so tight caps and stop sequences bound server-side latency
+QUESTION_MAX_TOKENS = 200
+FOLLOWUP_MAX_TOKENS = 120
+SUMMARY_MAX_TOKENS = 600
+SUMMARY_TEMPERATURE = 0.3  # analysis, not creative writing: keep it consistent
+QUESTION_STOP = ["\n\n\n", "Question 2:"]
+
+# Technical questions requested per GROQ call and served one per click
+QUESTION_POOL_SIZE = 3
+JSON_ARRAY_PATTERN = re.compile(r'\[.*\]', re.DOTALL)
+
+# Skip detection: any whole-word indicator, or a bare short acknowledgement
+SKIP_PATTERN = re.compile(r'\b(?:' + '|'.join(map(re.escape, (
+    'skip', 'next', 'pass', 'dont want', "don't want", 'nothing',
+    'no idea', 'dont know', "don't know", 'move on', 'next question',
+    'i have no idea', 'no experience', 'not sure', 'unsure'
+))) + r')\b')
+SKIP_WORDS = frozenset({'okay', 'ok', 'yes', 'no', 'idk', 'nope'})
+
+# Candidate info extraction patterns
+# A name is any run of Unicode-letter words (O'Brien, Jean-Luc) up to punctuation or the end
+NAME_PATTERN = re.compile(
+    r"\b(?:my name is|my name's|i am|i'?m|call me|named)\s+"
+    r"([^\W\d_]+(?:['’-][^\W\d_]+)*(?:\s+[^\W\d_]+(?:['’-][^\W\d_]+)*)*)",
+    re.IGNORECASE
+)
+NAME_MAX_WORDS = 5
+# Words that mean the phrase after "I am" is a description, not a name.
+# Articles only count as a leading word ("An" is also a given name).
+NON_NAME_LEADING_WORDS = frozenset({'a', 'an', 'the'})
+NON_NAME_WORDS = frozenset({
+    'and', 'from', 'in', 'at', 'with', 'for', 'of', 'named',
+    'not', 'here', 'looking', 'interested', 'applying', 'currently', 'working',
+    'developer', 'engineer', 'student', 'fresher', 'graduate'
+})
+EMAIL_PATTERN = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+EXPERIENCE_PATTERN = re.compile(r'year|exp|yr', re.IGNORECASE)
+FRESHER_PATTERN = re.compile(r'fresh|new|graduate', re.IGNORECASE)
+
+def ensure_chat_state():
+    """Initialize the session state keys the chat relies on, once per rerun"""
+    state = st.session_state
+    state.setdefault('conversation_history', [])
+    state.setdefault('candidate_info', {})
+    state.setdefault('question_count', 0)
+    state.setdefault('asked_questions', [])
+    state.setdefault('skip_requests', 0)
+    state.setdefault('current_stage', 'greeting')
+    state.setdefault('interview_started', False)
+
+@st.fragment
 def render_chat_interface(client):
-    """Enhanced chat interface with smart question generation"""
+    """Enhanced chat interface with smart question generation
+    
+    Runs as a fragment: chat turns and control clicks rerun only this block,
+    not the sidebar and analytics tabs, unless they change what those display.
+    """
+    # A callback action changed app-wide state; redraw everything before drawing the chat
+    if st.session_state.pop('full_rerun_pending', False):
+        st.rerun()
+    
+    ensure_chat_state()
     
     st.header("💬 Interview Chat")
     
     # Display conversation history
     display_chat_messages()
+    # Replies streamed by the control buttons land here, right under the history
+    chat_slot = st.container()
     
     # Interview controls
     if not st.session_state.get('interview_started', False):
         render_start_button(client)
     else:
         # Show current stage info and enhanced controls
-        render_stage_info_and_controls(client)
+        render_stage_info_and_controls(client, chat_slot)
         # Handle user input
         handle_chat_input(client)
 
+def app_state_signature():
+    """Chat state the sidebar also displays: stage, profile fields collected, questions asked"""
+    state = st.session_state
+    return (
+        state.get('current_stage'),
+        len(state.get('candidate_info', {})),
+        len(state.get('asked_questions', []))
+    )
+
+def rerun_chat(before=None):
+    """Rerun just the chat fragment, or the whole app when not inside a fragment run
+    
+    Pass the app_state_signature() taken before the turn: if the turn changed it,
+    the whole app reruns so the sidebar and tabs stay current.
+    """
+    if before is not None and before != app_state_signature():
+        st.rerun()
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
 def display_chat_messages():
     """Display all chat messages with proper formatting"""
     messages = st.session_state.get('conversation_history', [])
     
     if not messages:
         with st.chat_message("assistant", avatar="🤖"):
-            st.markdown("""
-            👋 **Welcome to TalentScout AI!**
-            
-            I'm your AI interviewer, powered by **Llama 3.3 70B**. I'll conduct a comprehensive interview by:
-            
-            🎯 **Smart Question Generation:**
-            - **Single Tech** (e.g., "Python") → Deep Python-focused questions
-            - **Multiple Tech** (e.g., "Python, GenAI, LLM") → Integration questions covering ALL technologies
-            
-            💻 **Adaptive Interview Flow:**
-            - Auto-generates diverse questions
-            - Handles skip requests intelligently  
-            - Provides real-time analytics
-            - Professional interview experience
-            
-            Click **Start Interview** when you're ready!
-            """)
+            st.markdown(WELCOME_MD)
     else:
+        # Older messages collapse into one markdown block so reruns stay cheap
+        if len(messages) > CHAT_WINDOW:
+            archived = messages[:-CHAT_WINDOW]
+            with st.expander(f"📜 Earlier messages ({len(archived)} hidden)", expanded=False):
+                st.markdown(get_archived_markdown(messages, len(archived)))
+            messages = messages[-CHAT_WINDOW:]
+        
         for message in messages:
             role = message.get('role', '')
             content = message.get('content', '')
@@ -60,25 +323,48 @@ def display_chat_messages():
                 with st.chat_message("user", avatar="👤"):
                     st.markdown(content)
 
-def render_stage_info_and_controls(client):
-    """Enhanced stage info with smart controls"""
+def get_archived_markdown(messages, archived_count):
+    """Markdown for messages older than the chat window, extended only by newly archived messages
+    
+    Keyed on id(messages); anything that replaces the history must drop archived_markdown.
+    """
+    cached = st.session_state.get('archived_markdown')
+    
+    if cached and cached[0] == id(messages) and cached[1] == archived_count:
+        return cached[2]
+    
+    if cached and cached[0] == id(messages) and cached[1] < archived_count:
+        start, parts = cached[1], [cached[2]] if cached[2] else []
+    else:
+        start, parts = 0, []
+    
+    parts.extend(
+        f"{ARCHIVE_SPEAKERS[m['role']]} {m.get('content', '')}"
+        for m in messages[start:archived_count] if m.get('role') in ARCHIVE_SPEAKERS
+    )
+    markdown = "\n\n---\n\n".join(parts)
+    st.session_state.archived_markdown = (id(messages), archived_count, markdown)
+    
+    return markdown
+
+def render_stage_info_and_controls(client, chat_slot):
+    """Enhanced stage info with smart controls; streaming actions draw into chat_slot"""
     stage = st.session_state.get('current_stage', 'greeting')
     candidate_info = st.session_state.get('candidate_info', {})
     
-    # Stage information with tech focus
-    tech_stack = candidate_info.get('tech_stack', '')
-    tech_count = len([tech.strip() for tech in tech_stack.split(',') if tech.strip()]) if tech_stack else 0
-    tech_mode = f"Single-Tech Focus: {tech_stack}" if tech_count == 1 else f"Multi-Tech Integration: {tech_count} technologies"
-    
-    stage_messages = {
-        'greeting': "👋 **Current Stage:** Initial Greeting",
-        'info_collection': f"📝 **Current Stage:** Information Collection (Collected: {len(candidate_info)} items)",
-        'technical_assessment': f"💻 **Current Stage:** Technical Assessment | {tech_mode}",
-        'behavioral_assessment': f"🧠 **Current Stage:** Behavioral Assessment", 
-        'wrap_up': "✅ **Current Stage:** Interview Complete"
-    }
+    # Stage information; only the technical banner needs the tech focus
+    if stage == 'technical_assessment':
+        tech_stack = candidate_info.get('tech_stack', '')
+        tech_count = len(split_tech_stack(tech_stack)) if tech_stack else 0
+        tech_mode = f"Single-Tech Focus: {tech_stack}" if tech_count == 1 else f"Multi-Tech Integration: {tech_count} technologies"
+        banner = STAGE_BANNERS[stage].format(tech_mode=tech_mode)
+    elif stage == 'info_collection':
+        banner = STAGE_BANNERS[stage].format(collected=len(candidate_info))
+    else:
+        banner = STAGE_BANNERS.get(stage, "Interview in progress...")
     
-    st.info(stage_messages.get(stage, "Interview in progress..."))
+    st.info(banner)
+    show_action_status()
     
     # Enhanced Controls Section
     if stage in ['technical_assessment', 'behavioral_assessment']:
@@ -96,37 +382,68 @@ def render_stage_info_and_controls(client):
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            if st.button("🎯 Smart Question", use_container_width=True, type="primary"):
-                generate_smart_question(client)
-                st.rerun()
+            control_button("🎯 Smart Question", generate_smart_question, client, slot=chat_slot, type="primary")
         
         with col2:
-            if st.button("🔄 Follow-up", use_container_width=True, type="secondary"):
-                generate_smart_followup(client)
-                st.rerun()
+            control_button("🔄 Follow-up", generate_smart_followup, client, slot=chat_slot, type="secondary")
         
         with col3:
-            if st.button("⏭️ Skip Topic", use_container_width=True, type="secondary"):
-                skip_current_topic(client)
-                st.rerun()
+            control_button("⏭️ Skip Topic", skip_current_topic, client, slot=chat_slot, type="secondary")
         
         # Additional controls
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            if st.button("📊 Generate Summary", use_container_width=True):
-                generate_interview_summary(client)
-                st.rerun()
+            control_button("📊 Generate Summary", generate_interview_summary, client, slot=chat_slot)
         
         with col2:
-            if st.button("🔄 Repeat Question", use_container_width=True):
-                repeat_last_question()
-                st.rerun()
+            callback_button("🔄 Repeat Question", repeat_last_question)
         
         with col3:
-            if st.button("⏭️ Next Stage", use_container_width=True):
-                advance_to_next_stage(client)
-                st.rerun()
+            callback_button("⏭️ Next Stage", advance_to_next_stage, client)
+
+def control_button(label, action, *args, slot, **button_kwargs):
+    """Render a full-width control button that runs an action and reruns when clicked
+    
+    For actions that stream into the chat: the action draws inside slot, a full-width
+    container under the history, not the button's column; the rerun then moves the
+    new bubble into the history.
+    """
+    if st.button(label, use_container_width=True, **button_kwargs):
+        before = app_state_signature()
+        with slot:
+            action(*args)
+        rerun_chat(before)
+
+def callback_button(label, action, *args, **button_kwargs):
+    """Render a full-width control button whose state-only action runs as an on_click callback
+    
+    The click's own rerun already renders the result, so no second rerun is needed.
+    Callbacks cannot draw, so the action reports through set_action_status.
+    """
+    st.button(label, on_click=run_callback_action, args=(action, *args),
+              use_container_width=True, **button_kwargs)
+
+def run_callback_action(action, *args):
+    """Run a callback action, flagging a full rerun when it changed app-wide state
+    
+    Callbacks cannot call st.rerun themselves; render_chat_interface picks up the flag.
+    """
+    before = app_state_signature()
+    action(*args)
+    if app_state_signature() != before:
+        st.session_state.full_rerun_pending = True
+
+def set_action_status(kind, text):
+    """Queue a status message (success/info/warning/error) for the next render"""
+    st.session_state.last_action_status = (kind, text)
+
+def show_action_status():
+    """Show and clear the status left by the last callback action"""
+    status = st.session_state.pop('last_action_status', None)
+    if status:
+        kind, text = status
+        getattr(st, kind)(text)
 
 def render_start_button(client):
     """Render start interview button"""
@@ -134,52 +451,40 @@ def render_start_button(client):
     with col2:
         if st.button("🚀 Start Interview", type="primary", use_container_width=True):
             start_interview(client)
+            # Starting changes app-wide state (sidebar, analytics), so rerun everything
             st.rerun()
 
 def start_interview(client):
     """Initialize interview with proper greeting"""
     st.session_state.interview_started = True
     st.session_state.interview_start_time = datetime.now()
+    st.session_state.interview_start_monotonic = time.monotonic()
     st.session_state.current_stage = 'greeting'
     st.session_state.question_count = 0
+    st.session_state.asked_questions = []
+    # Drop the previous interview's archive; id() of a new history list can repeat
+    st.session_state.pop('archived_markdown', None)
     st.session_state.auto_generate_questions = True
     st.session_state.current_tech_focus = 0
     st.session_state.skip_requests = 0
     
-    if 'conversation_history' not in st.session_state:
-        st.session_state.conversation_history = []
-    
     # Generate initial greeting
-    greeting = """Hello! I'm your AI interviewer from TalentScout. I'll conduct a comprehensive technical interview with **intelligent question generation**.
-
-✨ **Smart Features:**
-- **Tech-Specific Questions:** Single tech = deep dive, Multiple tech = integration
-- **Auto-Generation:** Questions appear automatically based on your responses
-- **Skip-Friendly:** Say "skip" or "next" to move forward anytime
-
-Let's start with the basics. **What's your full name?**"""
-    
-    add_message('assistant', greeting)
+    add_message('assistant', GREETING_MD)
     st.session_state.question_count += 1
 
 def detect_skip_request(user_input):
     """Detect if user wants to skip current question/topic"""
-    skip_indicators = [
-        'skip', 'next', 'pass', 'dont want', "don't want", 'nothing', 
-        'no idea', 'dont know', "don't know", 'move on', 'next question',
-        'i have no idea', 'no experience', 'not sure', 'unsure'
-    ]
-    
-    user_lower = user_input.lower().strip()
+    # Normalize once; every check below reads the same lowered text
+    user_lower = user_input.strip().lower()
     
     # Check for explicit skip words
-    explicit_skip = any(indicator in user_lower for indicator in skip_indicators)
+    explicit_skip = SKIP_PATTERN.search(user_lower) is not None
     
     # Check for very short responses (likely avoidance)
-    too_short = len(user_input.strip()) <= 4
+    too_short = len(user_lower) <= 4
     
     # Check for single word responses that indicate skipping
-    single_word_skip = user_input.strip().lower() in ['okay', 'ok', 'yes', 'no', 'idk', 'nope']
+    single_word_skip = user_lower in SKIP_WORDS
     
     return explicit_skip or (too_short and single_word_skip)
 
@@ -188,18 +493,23 @@ def handle_chat_input(client):
     user_input = st.chat_input("Type your response... (say 'skip' to move to next question)")
     
     if user_input and user_input.strip():
+        state = st.session_state
+        before = app_state_signature()
+        
         # Add user message
         add_message('user', user_input)
         
         # Check for skip request
         if detect_skip_request(user_input):
-            st.session_state.skip_requests = st.session_state.get('skip_requests', 0) + 1
+            state.skip_requests += 1
             handle_skip_request(client)
         else:
-            # Reset skip counter on normal response
-            st.session_state.skip_requests = 0
-            # Extract information based on current stage
-            extract_candidate_info(user_input)
+            # Reset skip counter on normal response, writing only when it changes
+            if state.skip_requests:
+                state.skip_requests = 0
+            # Extract information while the profile is still being collected
+            if state.current_stage in ('greeting', 'info_collection'):
+                extract_candidate_info(user_input)
             
             # Generate appropriate AI response
             with st.spinner("🤖 AI is analyzing your response..."):
@@ -207,15 +517,19 @@ def handle_chat_input(client):
                 add_message('assistant', ai_response)
                 
                 # Auto-generate follow-up if enabled and in assessment stages
-                if (st.session_state.get('auto_generate_questions', True) and 
-                    st.session_state.get('current_stage') in ['technical_assessment', 'behavioral_assessment']):
+                # (re-read the stage: the response above may have advanced it)
+                if (state.get('auto_generate_questions', True) and 
+                    state.current_stage in ('technical_assessment', 'behavioral_assessment')):
                     auto_generate_next_question(client)
                 
                 # Update counters and check for stage advancement
-                st.session_state.question_count = st.session_state.get('question_count', 0) + 1
+                state.question_count += 1
                 check_stage_advancement()
+            
+            # Warm the next question pool while the candidate reads the reply
+            schedule_question_prefetch(client)
         
-        st.rerun()
+        rerun_chat(before)
 
 def handle_skip_request(client):
     """Handle user skip requests intelligently"""
@@ -252,37 +566,21 @@ def generate_alternative_question(client):
 def get_alternative_technical_question(candidate_info):
     """Get alternative technical questions based on tech stack"""
     tech_stack = candidate_info.get('tech_stack', 'programming')
-    technologies = [tech.strip() for tech in tech_stack.split(',') if tech.strip()]
+    technologies = split_tech_stack(tech_stack)
     
     if len(technologies) == 1:
         # Single tech alternatives
-        single_tech = technologies[0]
-        alt_questions = [
-            f"**Basic Concepts:** What are the key features of {single_tech} that make it suitable for your projects?",
-            f"**Problem-Solving:** How would you debug a performance issue in a {single_tech} application?",
-            f"**Best Practices:** What coding standards do you follow when writing {single_tech} code?"
-        ]
-    else:
-        # Multi-tech alternatives
-        alt_questions = [
-            f"**Technology Choice:** Why would you choose {technologies[0]} over other alternatives for a new project?",
-            f"**Integration:** How do these technologies ({', '.join(technologies)}) complement each other in your work?",
-            f"**Learning:** Which of these technologies ({', '.join(technologies)}) did you find most challenging to learn and why?"
-        ]
+        return random.choice(ALT_SINGLE_TECH_QUESTIONS).format(tech=technologies[0])
     
-    return random.choice(alt_questions)
+    # Multi-tech alternatives
+    return random.choice(ALT_MULTI_TECH_QUESTIONS).format(
+        first=technologies[0],
+        techs=', '.join(technologies)
+    )
 
 def get_alternative_behavioral_question():
     """Get simple alternative behavioral questions"""
-    alt_questions = [
-        "**Learning:** Tell me about a new skill you learned recently. How did you approach it?",
-        "**Challenges:** Describe a work challenge you faced. How did you handle it?",
-        "**Teamwork:** How do you prefer to work - independently or in a team? Why?",
-        "**Goals:** What are your career goals for the next 2-3 years?",
-        "**Motivation:** What motivates you most in your work?"
-    ]
-    
-    return random.choice(alt_questions)
+    return random.choice(ALT_BEHAVIORAL_QUESTIONS)
 
 def auto_generate_next_question(client):
     """Auto-generate next question based on stage and tech stack"""
@@ -296,54 +594,49 @@ def auto_generate_next_question(client):
     elif stage == 'behavioral_assessment':
         generate_smart_behavioral_question(client, auto=True)
 
+def build_technical_question_prompt(candidate_info):
+    """Build the technical question prompt for the candidate's tech stack"""
+    tech_stack = candidate_info.get('tech_stack', 'programming')
+    experience = candidate_info.get('experience', '2-3 years')
+    technologies = split_tech_stack(tech_stack)
+    tech_count = len(technologies)
+    
+    if tech_count == 1:
+        # SINGLE TECHNOLOGY - Deep dive questions
+        prompt = SINGLE_TECH_PROMPT.format(tech=technologies[0], experience=experience)
+    else:
+        # MULTIPLE TECHNOLOGIES - Integration questions
+        prompt = MULTI_TECH_PROMPT.format(techs=', '.join(technologies), experience=experience, tech_count=tech_count)
+    
+    return prompt, technologies
+
+@functools.lru_cache(maxsize=256)
+def split_tech_stack(tech_stack):
+    """Split a comma-separated tech stack into a tuple of names, parsed once per distinct string"""
+    return tuple(tech.strip() for tech in tech_stack.split(',') if tech.strip())
+
 def generate_smart_question(client, auto=False):
     """Generate questions based on single vs multiple technologies"""
     try:
         candidate_info = st.session_state.get('candidate_info', {})
-        tech_stack = candidate_info.get('tech_stack', 'programming')
-        experience = candidate_info.get('experience', '2-3 years')
-        technologies = [tech.strip() for tech in tech_stack.split(',') if tech.strip()]
+        prompt, technologies = build_technical_question_prompt(candidate_info)
         tech_count = len(technologies)
         
-        with st.spinner("🧠 Generating smart question..."):
-            
-            if tech_count == 1:
-                # SINGLE TECHNOLOGY - Deep dive questions
-                single_tech = technologies[0]
-                
-                prompt = f"""Create a focused technical question for {single_tech} with {experience} experience.
-
-Requirements:
-- Focus EXCLUSIVELY on {single_tech}
-- Test practical knowledge and real-world application
-- Include scenario-based problem solving
-- Appropriate difficulty for {experience} level
-- Avoid generic questions
-
-Format: Present a specific {single_tech} challenge or technical scenario."""
-                
-                prefix = f"🐍 **{single_tech}-Focused Question:**" if auto else f"🎯 **Deep {single_tech} Question:**"
-                
-            else:
-                # MULTIPLE TECHNOLOGIES - Integration questions
-                all_techs = ', '.join(technologies)
-                
-                prompt = f"""Create a technical question that integrates {all_techs} for {experience} experience.
-
-Requirements:
-- Combine ALL technologies: {all_techs}
-- Focus on integration and how they work together
-- Real-world system design scenario
-- Test understanding of technology interactions
-- Include architecture considerations
-
-Format: Present a system integration challenge using all {tech_count} technologies."""
-                
-                prefix = f"🔗 **Multi-Tech Integration:**" if auto else f"🎯 **{tech_count}-Technology Question:**"
-            
-            # Generate the question
-            ai_question = get_groq_response(client, prompt, [])
-            add_message('assistant', f"{prefix}\n\n{ai_question}")
+        if tech_count == 1:
+            single_tech = technologies[0]
+            prefix = f"🐍 **{single_tech}-Focused Question:**" if auto else f"🎯 **Deep {single_tech} Question:**"
+        else:
+            prefix = f"🔗 **Multi-Tech Integration:**" if auto else f"🎯 **{tech_count}-Technology Question:**"
+        
+        # Serve from the prefetched pool; on a miss stream one question while the pool refills
+        question = take_pooled_question(client, prompt)
+        if question:
+            with st.chat_message("assistant", avatar="🤖"):
+                st.markdown(f"{prefix}\n\n{question}")
+            add_message('assistant', f"{prefix}\n\n{question}")
+        else:
+            stream_assistant_message(client, prompt, prefix, cache_name='questions',
+                                     max_tokens=QUESTION_MAX_TOKENS, stop=QUESTION_STOP)
         
         if not auto:
             tech_type = "single-technology" if tech_count == 1 else "multi-technology integration"
@@ -352,22 +645,94 @@ Format: Present a system integration challenge using all {tech_count} technologi
     except Exception as e:
         st.error(f"Failed to generate question: {str(e)}")
 
+def fetch_question_pool(client, prompt):
+    """Generate several questions for the same prompt in a single GROQ call
+    
+    Touches no session state, so it is safe to run on the prefetch executor.
+    """
+    pool_prompt = f"""{prompt}
+
+Create {QUESTION_POOL_SIZE} distinct questions following these requirements.
+Return ONLY a JSON array of {QUESTION_POOL_SIZE} strings, e.g. ["question 1", "question 2", "question 3"]."""
+    
+    questions = []
+    try:
+        raw = get_groq_response(client, pool_prompt, [], max_tokens=QUESTION_MAX_TOKENS * QUESTION_POOL_SIZE)
+        array_match = JSON_ARRAY_PATTERN.search(raw)
+        if array_match:
+            questions = [q.strip() for q in json.loads(array_match.group()) if isinstance(q, str) and q.strip()]
+    except (ValueError, TypeError):
+        questions = []
+    
+    return questions
+
+def collect_question_pool(prompt):
+    """Fill the question pool from a finished background prefetch for this prompt
+    
+    Never waits: a prefetch still running is left in place for a later click.
+    """
+    pending = st.session_state.get('question_pool_future')
+    if not pending or pending['prompt'] != prompt or not pending['future'].done():
+        return []
+    
+    del st.session_state['question_pool_future']
+    try:
+        questions = pending['future'].result()
+    except Exception:
+        questions = []
+    
+    st.session_state.question_pool = {'prompt': prompt, 'questions': questions}
+    return questions
+
+@st.cache_resource
+def get_prefetch_executor():
+    """Process-wide worker threads for GROQ calls that run behind the UI"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="question-prefetch")
+
+def schedule_question_prefetch(client):
+    """Refill the technical question pool in the background while the candidate reads"""
+    if st.session_state.get('current_stage') != 'technical_assessment':
+        return
+    
+    prompt, _ = build_technical_question_prompt(st.session_state.get('candidate_info', {}))
+    pool = st.session_state.get('question_pool')
+    if pool and pool['prompt'] == prompt and pool['questions']:
+        return
+    
+    pending = st.session_state.get('question_pool_future')
+    if pending and pending['prompt'] == prompt:
+        return
+    
+    st.session_state.question_pool_future = {
+        'prompt': prompt,
+        'future': get_prefetch_executor().submit(fetch_question_pool, client, prompt)
+    }
+
+def take_pooled_question(client, prompt):
+    """Pop the next pooled question for this prompt, refilling the pool when empty
+    
+    Returns None on a miss so the caller streams a single question; the pool
+    refills in the background meanwhile.
+    """
+    pool = st.session_state.get('question_pool')
+    
+    if not pool or pool['prompt'] != prompt or not pool['questions']:
+        if not collect_question_pool(prompt):
+            schedule_question_prefetch(client)
+            return None
+        pool = st.session_state.question_pool
+    
+    question = pool['questions'].pop(0)
+    if not pool['questions']:
+        schedule_question_prefetch(client)
+    return question
+
 def generate_smart_behavioral_question(client, auto=False):
     """Generate smart behavioral questions"""
     try:
-        behavioral_topics = [
-            "Problem-Solving and Critical Thinking",
-            "Team Collaboration and Communication", 
-            "Learning and Professional Development",
-            "Leadership and Initiative",
-            "Adaptability and Change Management",
-            "Time Management and Prioritization"
-        ]
+        topic = random.choice(BEHAVIORAL_TOPICS)
         
-        topic = random.choice(behavioral_topics)
-        
-        with st.spinner("🧠 Generating behavioral question..."):
-            prompt = f"""Create a behavioral interview question about "{topic}":
+        prompt = f"""Create a behavioral interview question about "{topic}":
 
 Requirements:
 - Use STAR method (Situation, Task, Action, Result)
@@ -377,11 +742,10 @@ Requirements:
 - Test both skill and self-awareness
 
 Format: Ask for a specific example using STAR format."""
-            
-            behavioral_question = get_groq_response(client, prompt, [])
-            
-            prefix = "🧠 **Auto-Generated Behavioral:**" if auto else "🎯 **Smart Behavioral Question:**"
-            add_message('assistant', f"{prefix}\n\n{behavioral_question}")
+        
+        prefix = "🧠 **Auto-Generated Behavioral:**" if auto else "🎯 **Smart Behavioral Question:**"
+        stream_assistant_message(client, prompt, prefix, cache_name='questions',
+                                 max_tokens=QUESTION_MAX_TOKENS, stop=QUESTION_STOP)
         
         if not auto:
             st.success("✨ Behavioral question generated!")
@@ -392,17 +756,15 @@ Format: Ask for a specific example using STAR format."""
 def generate_smart_followup(client):
     """Generate intelligent follow-up questions"""
     try:
-        messages = st.session_state.get('conversation_history', [])
-        user_messages = [m for m in messages if m.get('role') == 'user']
+        last_user = last_message_by('user')
         
-        if not user_messages:
+        if not last_user:
             st.warning("⚠️ No responses yet to create follow-up questions.")
             return
         
-        last_response = user_messages[-1]['content']
+        last_response = last_user['content']
         
-        with st.spinner("🔄 Generating smart follow-up..."):
-            prompt = f"""The candidate responded: "{last_response}"
+        prompt = f"""The candidate responded: "{last_response}"
 
 Generate a thoughtful follow-up question that:
 - Digs deeper into their specific approach
@@ -412,9 +774,9 @@ Generate a thoughtful follow-up question that:
 - Avoids generic follow-ups
 
 Make it specific and insightful."""
-            
-            followup = get_groq_response(client, prompt, [])
-            add_message('assistant', f"🔄 **Smart Follow-up:**\n\n{followup}")
+        
+        stream_assistant_message(client, prompt, "🔄 **Smart Follow-up:**", cache_name='followups',
+                                 max_tokens=FOLLOWUP_MAX_TOKENS, stop=QUESTION_STOP, tier='instant')
         
         st.success("✅ Smart follow-up generated!")
         
@@ -448,13 +810,12 @@ def generate_interview_summary(client):
             st.warning("⚠️ Need more conversation data for meaningful summary.")
             return
         
-        with st.spinner("📊 AI is analyzing the interview..."):
-            conversation_text = ""
-            for msg in messages[-12:]:
-                role = "Interviewer" if msg.get('role') == 'assistant' else "Candidate"
-                conversation_text += f"{role}: {msg.get('content', '')[:200]}...\n\n"
-            
-            prompt = f"""Analyze this interview and provide a professional summary:
+        conversation_text = "".join(
+            f"{'Interviewer' if msg.get('role') == 'assistant' else 'Candidate'}: {msg.get('content', '')[:200]}...\n\n"
+            for msg in messages[-12:]
+        )
+        
+        prompt = f"""Analyze this interview and provide a professional summary:
 
 **Candidate:** {candidate_info}
 
@@ -469,9 +830,9 @@ Provide:
 5. **Overall Assessment** - Initial impression
 
 Keep it professional and actionable."""
-            
-            summary = get_groq_response(client, prompt, [])
-            add_message('assistant', f"📊 **AI Interview Analysis:**\n\n{summary}")
+        
+        stream_assistant_message(client, prompt, "📊 **AI Interview Analysis:**",
+                                 max_tokens=SUMMARY_MAX_TOKENS, temperature=SUMMARY_TEMPERATURE)
         
         st.success("📋 Interview summary generated!")
         
@@ -481,134 +842,140 @@ Keep it professional and actionable."""
 def repeat_last_question():
     """Repeat the last question asked by the AI"""
     try:
-        messages = st.session_state.get('conversation_history', [])
-        ai_messages = [m for m in messages if m.get('role') == 'assistant']
+        last_ai = last_message_by('assistant')
         
-        if not ai_messages:
-            st.warning("⚠️ No previous questions to repeat.")
+        if not last_ai:
+            set_action_status('warning', "⚠️ No previous questions to repeat.")
             return
         
-        last_ai_message = ai_messages[-1]['content']
+        last_ai_message = last_ai['content']
         add_message('assistant', f"🔄 **Repeating for Clarity:**\n\n{last_ai_message}")
         
-        st.info("🔄 Last question repeated.")
+        set_action_status('info', "🔄 Last question repeated.")
         
     except Exception as e:
-        st.error(f"Failed to repeat question: {str(e)}")
+        set_action_status('error', f"Failed to repeat question: {str(e)}")
 
 def advance_to_next_stage(client):
     """Advance to the next interview stage"""
     try:
         current_stage = st.session_state.get('current_stage', 'greeting')
-        
-        stage_progression = {
-            'greeting': 'info_collection',
-            'info_collection': 'technical_assessment',
-            'technical_assessment': 'behavioral_assessment',
-            'behavioral_assessment': 'wrap_up'
-        }
-        
-        next_stage = stage_progression.get(current_stage, 'wrap_up')
+        next_stage = STAGE_PROGRESSION.get(current_stage, 'wrap_up')
         st.session_state.current_stage = next_stage
         
         # Generate transition message
-        transition_messages = {
-            'info_collection': "📝 **Information Collection Phase**\n\nLet's gather details about your background.",
-            'technical_assessment': "💻 **Technical Assessment Phase**\n\nTime for technical questions based on your skills.",
-            'behavioral_assessment': "🧠 **Behavioral Assessment Phase**\n\nLet's explore your soft skills and work approach.",
-            'wrap_up': generate_interview_completion()
-        }
-        
-        message = transition_messages.get(next_stage, "Moving to next stage...")
+        if next_stage == 'wrap_up':
+            message = generate_interview_completion()
+        else:
+            message = STAGE_TRANSITION_MESSAGES.get(next_stage, "Moving to next stage...")
         add_message('assistant', message)
         
-        st.success(f"⏭️ Advanced to: {next_stage.replace('_', ' ').title()}")
+        # Entering the technical stage: start generating questions while the banner renders
+        schedule_question_prefetch(client)
+        
+        set_action_status('success', f"⏭️ Advanced to: {next_stage.replace('_', ' ').title()}")
         
     except Exception as e:
-        st.error(f"Failed to advance stage: {str(e)}")
+        set_action_status('error', f"Failed to advance stage: {str(e)}")
+
+def looks_like_name(text):
+    """True for a short run of words that does not read like a self-description"""
+    words = text.lower().split()
+    return (0 < len(words) <= NAME_MAX_WORDS
+            and not (len(words) > 1 and words[0] in NON_NAME_LEADING_WORDS)
+            and NON_NAME_WORDS.isdisjoint(words))
+
+def extract_name(user_clean, candidate_info):
+    # "Hi, I'm Alice Smith." -> "Alice Smith"; "I am a developer named Bob" -> "Bob".
+    # A reply with no plausible introduced name is taken whole, as before.
+    text = unicodedata.normalize('NFC', user_clean)
+    name = text
+    pos = 0
+    while (name_match := NAME_PATTERN.search(text, pos)):
+        if looks_like_name(name_match.group(1)):
+            name = name_match.group(1)
+            break
+        pos = name_match.start() + 1
+    candidate_info['name'] = name.title()
+
+def extract_email(user_clean, candidate_info):
+    # No '@' means no address; skip the regex
+    if '@' not in user_clean:
+        return
+    email_match = EMAIL_PATTERN.search(user_clean)
+    if email_match:
+        candidate_info['email'] = email_match.group()
+
+def extract_experience(user_clean, candidate_info):
+    # Enhanced experience extraction
+    if user_clean.isdigit():
+        candidate_info['experience'] = f"{user_clean} years"
+    elif EXPERIENCE_PATTERN.search(user_clean):
+        candidate_info['experience'] = user_clean
+    elif FRESHER_PATTERN.search(user_clean):
+        candidate_info['experience'] = "Fresher"
+    else:
+        # Default: treat as years
+        candidate_info['experience'] = f"{user_clean} years"
+
+def extract_position(user_clean, candidate_info):
+    candidate_info['position'] = user_clean.title()
+
+def extract_tech_stack(user_clean, candidate_info):
+    candidate_info['tech_stack'] = user_clean
+
+# One extractor per profile field, dispatched for the first missing field
+FIELD_EXTRACTORS = {
+    'name': extract_name,
+    'email': extract_email,
+    'experience': extract_experience,
+    'position': extract_position,
+    'tech_stack': extract_tech_stack
+}
 
 def extract_candidate_info(user_input):
     """Robust information extraction with improved logic"""
-    if 'candidate_info' not in st.session_state:
-        st.session_state.candidate_info = {}
-    
     candidate_info = st.session_state.candidate_info
-    user_clean = user_input.strip()
-    user_lower = user_clean.lower()
     
     # Determine current question based on missing info
-    required_fields = ['name', 'email', 'experience', 'position', 'tech_stack']
-    
-    for field in required_fields:
-        if field not in candidate_info:
-            if field == 'name':
-                candidate_info['name'] = user_clean.title()
-                break
-            elif field == 'email':
-                if '@' in user_clean:
-                    candidate_info['email'] = user_clean
-                break
-            elif field == 'experience':
-                # Enhanced experience extraction
-                if user_clean.isdigit():
-                    candidate_info['experience'] = f"{user_clean} years"
-                elif any(word in user_lower for word in ['year', 'exp', 'yr']):
-                    candidate_info['experience'] = user_clean
-                elif any(word in user_lower for word in ['fresh', 'new', 'graduate']):
-                    candidate_info['experience'] = "Fresher"
-                else:
-                    # Default: treat as years
-                    candidate_info['experience'] = f"{user_clean} years"
-                break
-            elif field == 'position':
-                candidate_info['position'] = user_clean.title()
-                break
-            elif field == 'tech_stack':
-                candidate_info['tech_stack'] = user_clean
-                break
+    next_field = next((field for field in REQUIRED_INFO if field not in candidate_info), None)
+    if next_field:
+        FIELD_EXTRACTORS[next_field](user_input.strip(), candidate_info)
 
 def generate_contextual_response(client, user_input):
     """Generate contextual AI response with proper flow"""
     stage = st.session_state.get('current_stage', 'greeting')
     candidate_info = st.session_state.get('candidate_info', {})
     
-    required_info = ['name', 'email', 'experience', 'position', 'tech_stack']
-    missing_info = [field for field in required_info if field not in candidate_info]
-    
     if stage in ['greeting', 'info_collection']:
-        if missing_info:
-            next_field = missing_info[0]
-            
-            field_questions = {
-                'name': f"Nice to meet you, **{candidate_info.get('name', 'there')}**! Could you please share your **email address**?",
-                'email': f"Perfect! How many **years of professional experience** do you have, {candidate_info.get('name', '')}?",
-                'experience': f"Great! **{candidate_info.get('experience', '')}** is excellent. What **type of position** are you interested in?",
-                'position': f"Perfect! What are your main **technical skills and technologies**?\n\n*Please list all technologies you work with (e.g., Python, GenAI, LLM, React, etc.)*",
-                'tech_stack': "Thank you for that comprehensive information!"
-            }
-            
+        # First missing field, found in a single pass
+        next_field = next((field for field in REQUIRED_INFO if field not in candidate_info), None)
+        
+        if next_field:
             # Return appropriate question based on what was just collected
-            last_collected = list(candidate_info.keys())[-1] if candidate_info else None
-            if last_collected and last_collected != next_field:
-                return field_questions.get(last_collected, field_questions.get(next_field, "Tell me more."))
-            else:
-                return field_questions.get(next_field, "Could you tell me more?")
+            last_collected = next(reversed(candidate_info), None)
+            ask = FIELD_Q.get(last_collected) or FIELD_Q.get(next_field)
+            return ask(candidate_info) if ask else "Could you tell me more?"
         else:
             # All info collected - transition to technical
             tech_stack = candidate_info.get('tech_stack', 'programming')
-            technologies = [tech.strip() for tech in tech_stack.split(',') if tech.strip()]
+            technologies = split_tech_stack(tech_stack)
             tech_count = len(technologies)
             
             st.session_state.current_stage = 'technical_assessment'
             
+            profile = PROFILE_SUMMARY_TEMPLATE.format(
+                name=candidate_info.get('name', 'Not provided'),
+                experience=candidate_info.get('experience', 'Not specified'),
+                position=candidate_info.get('position', 'Not specified'),
+                tech_label='Technology' if tech_count == 1 else 'Technologies',
+                tech_stack=candidate_info.get('tech_stack', 'Not specified')
+            )
+            
             if tech_count == 1:
                 return f"""Perfect! I see you specialize in **{technologies[0]}**.
 
-**📋 Complete Profile:**
-- **Name:** {candidate_info.get('name', 'Not provided')}
-- **Experience:** {candidate_info.get('experience', 'Not specified')}
-- **Position:** {candidate_info.get('position', 'Not specified')}
-- **Technology:** {candidate_info.get('tech_stack', 'Not specified')}
+{profile}
 
 🎯 **Assessment Strategy:** Since you work with {technologies[0]}, I'll generate **focused questions specifically about {technologies[0]}** - covering advanced concepts, best practices, and real-world applications.
 
@@ -619,11 +986,7 @@ def generate_contextual_response(client, user_input):
             else:
                 return f"""Excellent! I see you work with **{tech_count} technologies:** {', '.join(technologies)}.
 
-**📋 Complete Profile:**
-- **Name:** {candidate_info.get('name', 'Not provided')}
-- **Experience:** {candidate_info.get('experience', 'Not specified')}
-- **Position:** {candidate_info.get('position', 'Not specified')}
-- **Technologies:** {candidate_info.get('tech_stack', 'Not specified')}
+{profile}
 
 🎯 **Assessment Strategy:** Since you work with multiple technologies, I'll generate **integration questions that combine {', '.join(technologies)}** - testing how you use them together in real-world scenarios.
 
@@ -642,49 +1005,100 @@ def generate_contextual_response(client, user_input):
 
 def check_stage_advancement():
     """Check and advance interview stages automatically"""
-    candidate_info = st.session_state.get('candidate_info', {})
-    required_info = ['name', 'email', 'experience', 'position', 'tech_stack']
+    state = st.session_state
+    stage = state.current_stage
     
     # Auto-advance based on conversation length and info completion
-    if st.session_state.current_stage == 'greeting' and len(st.session_state.conversation_history) >= 4:
-        st.session_state.current_stage = 'info_collection'
+    if stage == 'greeting' and len(state.conversation_history) >= 4:
+        state.current_stage = 'info_collection'
     
-    elif st.session_state.current_stage == 'info_collection':
-        if all(field in candidate_info for field in required_info):
-            st.session_state.current_stage = 'technical_assessment'
+    elif stage == 'info_collection':
+        if all(field in state.candidate_info for field in REQUIRED_INFO):
+            state.current_stage = 'technical_assessment'
+
+def build_groq_messages(prompt, conversation_history):
+    """Build the GROQ message list: system prompt, recent context, then the prompt"""
+    messages = [SYSTEM_MESSAGE]
+    
+    # Add recent conversation context
+    for msg in conversation_history[-6:]:
+        if msg.get('role') and msg.get('content'):
+            messages.append({
+                "role": msg['role'],
+                "content": msg['content']
+            })
+    
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+def stream_groq_response(client, prompt, conversation_history, max_tokens=500, stop=None, tier='balanced',
+                         temperature=0.8):
+    """Yield GROQ response tokens as they arrive"""
+    stream = client.chat.completions.create(
+        model=GROQ_MODELS[tier],
+        messages=build_groq_messages(prompt, conversation_history),
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stop=stop,
+        stream=True
+    )
+    
+    for chunk in stream:
+        yield chunk.choices[0].delta.content or ""
+
+@st.cache_resource
+def get_response_cache():
+    """Process-wide cache of completed responses for repeatable prompts"""
+    return {
+        'lock': threading.Lock(),
+        'questions': TTLCache(maxsize=500, ttl=3600),
+        'followups': TTLCache(maxsize=500, ttl=300)  # follow-ups quote fresh user text
+    }
+
+def stream_assistant_message(client, prompt, prefix, cache_name=None, max_tokens=500, stop=None, tier='balanced',
+                             temperature=0.8):
+    """Stream an AI response into the chat, then store the completed message
+    
+    With cache_name set, identical prompts at the same point of an interview
+    are served from the shared response cache instead of calling GROQ again.
+    """
+    cache_key = None
+    content = None
+    
+    if cache_name:
+        cache = get_response_cache()
+        position = len(st.session_state.get('conversation_history', []))
+        cache_key = hashlib.sha1(f"{position}\x00{prompt}".encode()).hexdigest()
+        with cache['lock']:
+            content = cache[cache_name].get(cache_key)
+    
+    with st.chat_message("assistant", avatar="🤖"):
+        st.markdown(prefix)
+        if content is not None:
+            st.markdown(content)
+        else:
+            try:
+                content = st.write_stream(stream_groq_response(client, prompt, [], max_tokens, stop, tier, temperature))
+                if cache_key:
+                    with cache['lock']:
+                        cache[cache_name][cache_key] = content
+            except Exception as e:
+                content = f"I apologize, I'm experiencing technical difficulties: {str(e)}"
+                st.markdown(content)
+    
+    add_message('assistant', f"{prefix}\n\n{content}")
 
-def get_groq_response(client, prompt, conversation_history):
+def get_groq_response(client, prompt, conversation_history, max_tokens=200, stop=None, tier='balanced'):
     """Get response from GROQ API with enhanced prompting"""
     try:
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a professional technical interviewer. Create engaging, specific questions that test both technical knowledge and practical application. 
-
-Guidelines:
-- Be conversational and show genuine interest
-- Ask one focused question at a time
-- Make questions scenario-based and practical
-- Adapt difficulty to candidate's experience level
-- Avoid generic or textbook questions"""
-            }
-        ]
-        
-        # Add recent conversation context
-        for msg in conversation_history[-6:]:
-            if msg.get('role') and msg.get('content'):
-                messages.append({
-                    "role": msg['role'],
-                    "content": msg['content']
-                })
-        
-        messages.append({"role": "user", "content": prompt})
+        messages = build_groq_messages(prompt, conversation_history)
         
         response = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
+            model=GROQ_MODELS[tier],
             messages=messages,
             temperature=0.8,  # Higher creativity for diverse questions
-            max_tokens=500
+            max_tokens=max_tokens,
+            stop=stop
         )
         
         return response.choices[0].message.content
@@ -697,64 +1111,48 @@ def generate_interview_completion():
     name = st.session_state.candidate_info.get('name', 'there')
     tech_stack = st.session_state.candidate_info.get('tech_stack', 'your technologies')
     
-    return f"""🎉 **Interview Successfully Completed!**
-
-Thank you for your time, **{name}**! You've completed our comprehensive AI-powered technical interview.
-
-**📊 Interview Summary:**
-- ✅ **Technology Assessment:** {tech_stack}
-- ✅ **Questions Generated:** {st.session_state.get('question_count', 0)}
-- ✅ **Duration:** {calculate_duration()}
-- ✅ **Stages Completed:** All phases ✅
+    return COMPLETION_TEMPLATE.format(
+        name=name,
+        tech_stack=tech_stack,
+        question_count=st.session_state.get('question_count', 0),
+        duration=calculate_duration()
+    )
 
-**🎯 Key Highlights:**
-- Demonstrated technical expertise across your technology stack
-- Showed adaptability with AI-generated personalized questions
-- Maintained professional engagement throughout the process
-
-**📋 Assessment Coverage:**
-- **Technical Depth:** Advanced concepts and real-world applications
-- **Problem-Solving:** Scenario-based challenges
-- **Communication:** Clear articulation of technical concepts
-- **Professional Skills:** Behavioral competencies
-
-**🚀 Next Steps:**
-1. **Comprehensive Review:** Technical team analyzes your responses
-2. **Feedback Timeline:** You'll hear back within 24-48 hours
-3. **Potential Follow-up:** Technical deep-dive or team interviews
-4. **Decision Process:** Final decision within 3-5 business days
-
-**💡 Interview Innovations Used:**
-- AI-powered question generation
-- Technology-specific vs integration testing
-- Real-time conversation adaptation
-- Professional assessment methodology
-
-Thank you for choosing TalentScout AI - where intelligence meets talent! 🌟
-
-*Your interview data has been securely recorded for review.*"""
+def last_message_by(role):
+    """Return the most recent message from a role, walking back from the end of the history"""
+    messages = st.session_state.get('conversation_history', [])
+    return next((m for m in reversed(messages) if m.get('role') == role), None)
 
 def add_message(role, content):
     """Add message to conversation history with metadata"""
-    if 'conversation_history' not in st.session_state:
-        st.session_state.conversation_history = []
-    
-    st.session_state.conversation_history.append({
+    state = st.session_state
+    state.conversation_history.append({
         'role': role,
         'content': content,
         'timestamp': datetime.now(),
-        'stage': st.session_state.get('current_stage', 'greeting')
+        'stage': state.get('current_stage', 'greeting')
     })
+    # Substantive AI turns are tracked as they arrive so readers never rescan the history
+    if role == 'assistant' and len(content) > 50:
+        state.setdefault('asked_questions', []).append(content)
+
+def interview_elapsed_seconds():
+    """Whole seconds since the interview started, or None before it starts"""
+    start = st.session_state.get('interview_start_monotonic')
+    if start is not None:
+        return int(time.monotonic() - start)
+    if st.session_state.get('interview_start_time'):
+        return (datetime.now() - st.session_state.interview_start_time).seconds
+    return None
 
 def calculate_duration():
     """Calculate and format interview duration"""
-    if st.session_state.get('interview_start_time'):
-        duration = datetime.now() - st.session_state.interview_start_time
-        minutes = duration.seconds // 60
-        seconds = duration.seconds % 60
-        
-        if minutes > 0:
-            return f"{minutes} minutes {seconds} seconds"
-        else:
-            return f"{seconds} seconds"
-    return "0 minutes"
+    elapsed = interview_elapsed_seconds()
+    if elapsed is None:
+        return "0 minutes"
+    
+    minutes, seconds = divmod(elapsed, 60)
+    if minutes > 0:
+        return f"{minutes} minutes {seconds} seconds"
+    else:
+        return f"{seconds} seconds"
@@ -3,13 +3,38 @@ Advanced analytics component for TalentScout AI
 Comprehensive analytics dashboard with real-time insights and visualizations
 """
 
+import functools
+import re
 import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 from datetime import datetime, timedelta
 import numpy as np
-from typing import Dict, List
+from typing import Dict, FrozenSet, List
+
+from components.advanced_chat import interview_elapsed_seconds
+
+# Technical vocabulary matched as whole words (plurals included) in one regex pass
+TECH_KEYWORDS = (
+    'python', 'javascript', 'java', 'react', 'angular', 'vue', 'node',
+    'django', 'flask', 'api', 'database', 'sql', 'aws', 'docker',
+    'kubernetes', 'git', 'algorithm', 'framework', 'library'
+)
+TECH_TERM_PATTERN = re.compile(
+    r'\b(' + '|'.join(map(re.escape, sorted(TECH_KEYWORDS, key=len, reverse=True))) + r')s?\b',
+    re.IGNORECASE
+)
+
+# Interview progression chart: display names and each stage's position
+PROGRESSION_STAGES = ("Greeting", "Info Collection", "Technical", "Behavioral", "Completed")
+PROGRESSION_INDEX = {
+    "greeting": 0,
+    "info_collection": 1,
+    "technical_assessment": 2,
+    "behavioral_assessment": 3,
+    "completed": 4
+}
 
 def render_analytics():
     """Render comprehensive analytics dashboard"""
@@ -286,11 +311,12 @@ def render_system_statistics():
     with col1:
         st.write("**📈 Session Statistics**")
         
+        messages = st.session_state.get("messages", [])
         session_stats = {
             "Current Session Duration": calculate_session_duration(),
-            "Messages Exchanged": len(st.session_state.get("messages", [])),
+            "Messages Exchanged": len(messages),
             "Current Stage": st.session_state.get("conversation_stage", "greeting").replace("_", " ").title(),
-            "AI Questions Generated": len([m for m in st.session_state.get("messages", []) if "AI Generated" in m.get("content", "")])
+            "AI Questions Generated": sum(1 for m in messages if "AI Generated" in m.get("content", ""))
         }
         
         for key, value in session_stats.items():
@@ -312,22 +338,12 @@ def render_system_statistics():
     # Interview progression visualization
     st.subheader("🎯 Interview Progression")
     
-    stages = ["Greeting", "Info Collection", "Technical", "Behavioral", "Completed"]
     current_stage = st.session_state.get("conversation_stage", "greeting")
-    
-    stage_mapping = {
-        "greeting": 0,
-        "info_collection": 1,
-        "technical_assessment": 2,
-        "behavioral_assessment": 3,
-        "completed": 4
-    }
-    
-    current_index = stage_mapping.get(current_stage, 0)
+    current_index = PROGRESSION_INDEX.get(current_stage, 0)
     
     # Create progress visualization
     progress_data = []
-    for i, stage in enumerate(stages):
+    for i, stage in enumerate(PROGRESSION_STAGES):
         if i < current_index:
             status = "✅ Completed"
             color = "green"
@@ -401,29 +417,22 @@ def get_rating(score: float) -> str:
     else:
         return "❌ Poor"
 
+@functools.lru_cache(maxsize=256)
+def technical_terms_in(content: str) -> FrozenSet[str]:
+    """Technical terms mentioned in one message; reruns reuse the result for unchanged messages"""
+    return frozenset(term.lower() for term in TECH_TERM_PATTERN.findall(content))
+
 def detect_technical_terms(messages: List[Dict]) -> List[str]:
     """Detect technical terms in messages"""
     
-    tech_keywords = [
-        'python', 'javascript', 'java', 'react', 'angular', 'vue', 'node',
-        'django', 'flask', 'api', 'database', 'sql', 'aws', 'docker',
-        'kubernetes', 'git', 'algorithm', 'framework', 'library'
-    ]
-    
     found_terms = set()
     for msg in messages:
-        content_lower = msg["content"].lower()
-        for term in tech_keywords:
-            if term in content_lower:
-                found_terms.add(term)
+        found_terms |= technical_terms_in(msg["content"])
     
-    return sorted(list(found_terms))
+    return sorted(found_terms)
 
 def calculate_session_duration() -> str:
     """Calculate current session duration"""
     
-    start_time = st.session_state.get("interview_start_time", datetime.now())
-    duration = datetime.now() - start_time
-    minutes = duration.seconds // 60
-    seconds = duration.seconds % 60
+    minutes, seconds = divmod(interview_elapsed_seconds() or 0, 60)
     return f"{minutes}m {seconds}s"
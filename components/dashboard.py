@@ -64,16 +64,21 @@ def render_overview_section():
     # Recent activity summary
     st.subheader("📋 Recent Activity")
     
-    if st.session_state.get("messages"):
-        recent_messages = st.session_state.messages[-5:]
+    messages = st.session_state.get("messages")
+    if messages:
+        recent_messages = messages[-5:]
+        stage_label = st.session_state.get("conversation_stage", "unknown").replace("_", " ").title()
+        now = datetime.now()
         activity_data = []
         
         for msg in recent_messages:
+            timestamp = msg.get("timestamp", now)
+            content = msg["content"]
             activity_data.append({
-                "Time": msg.get("timestamp", datetime.now()).strftime("%H:%M:%S") if hasattr(msg.get("timestamp", datetime.now()), 'strftime') else str(msg.get("timestamp", datetime.now()))[:8],
+                "Time": timestamp.strftime("%H:%M:%S") if hasattr(timestamp, 'strftime') else str(timestamp)[:8],
                 "Type": "User Response" if msg["role"] == "user" else "AI Question",
-                "Preview": msg["content"][:50] + "..." if len(msg["content"]) > 50 else msg["content"],
-                "Stage": st.session_state.get("conversation_stage", "unknown").replace("_", " ").title()
+                "Preview": content[:50] + "..." if len(content) > 50 else content,
+                "Stage": stage_label
             })
         
         df_activity = pd.DataFrame(activity_data)
@@ -87,10 +92,11 @@ def render_sessions_section():
     st.subheader("👥 Interview Sessions")
     
     # Current session status
-    if st.session_state.get("candidate_data"):
+    candidate = st.session_state.get("candidate_data")
+    if candidate:
         st.success("🟢 Active Interview Session")
         
-        candidate = st.session_state.candidate_data
+        tech_stack = candidate.get("tech_stack", [])
         session_info = {
             "Session ID": st.session_state.get("session_id", "N/A"),
             "Candidate": candidate.get("name", "N/A"),
@@ -99,7 +105,7 @@ def render_sessions_section():
             "Experience": candidate.get("experience", "N/A"),
             "Current Stage": st.session_state.get("conversation_stage", "unknown").replace("_", " ").title(),
             "Messages": len(st.session_state.get("messages", [])),
-            "Tech Stack": ", ".join(candidate.get("tech_stack", [])[:3]) + "..." if len(candidate.get("tech_stack", [])) > 3 else ", ".join(candidate.get("tech_stack", []))
+            "Tech Stack": ", ".join(tech_stack[:3]) + "..." if len(tech_stack) > 3 else ", ".join(tech_stack)
         }
         
         # Display as metrics
@@ -8,6 +8,8 @@ from datetime import datetime
 import json
 import time
 
+from components.advanced_chat import interview_elapsed_seconds
+
 logger = logging.getLogger(__name__)
 
 # Optional imports with graceful fallback
@@ -24,6 +26,30 @@ try:
 except ImportError:
     PANDAS_AVAILABLE = False
 
+# Progress panel lookup tables, built once at import
+STAGE_PROGRESS_PERCENT = {
+    "greeting": 10,
+    "info_collection": 30,
+    "technical_assessment": 60,
+    "behavioral_assessment": 85,
+    "wrap_up": 100
+}
+STAGE_INDICATORS = (
+    ("👋", "Greeting", "greeting"),
+    ("📝", "Info Collection", "info_collection"),
+    ("💻", "Technical", "technical_assessment"),
+    ("🧠", "Behavioral", "behavioral_assessment"),
+    ("✅", "Complete", "wrap_up")
+)
+PROFILE_FIELDS = ("name", "email", "experience", "position", "tech_stack")
+PROFILE_FIELD_ICONS = {
+    "name": "👤",
+    "email": "📧",
+    "experience": "⏰",
+    "position": "🎯",
+    "tech_stack": "💻"
+}
+
 def initialize_session_state():
     """Initialize session state with consistent keys including AI status"""
     defaults = {
@@ -32,6 +58,7 @@ def initialize_session_state():
         "interview_start_time": None,
         "candidate_info": {},
         "question_count": 0,
+        "asked_questions": [],
         "interview_started": False,
         "assessment_scores": [],
         "sentiment_history": [],
@@ -102,8 +129,7 @@ def render_sidebar():
 def render_header():
     """Render animated header with AI status"""
     try:
-        ai_count = len([m for m in st.session_state.conversation_history 
-                       if m.get("role") == "assistant" and len(m.get("content", "")) > 50])
+        ai_count = len(st.session_state.asked_questions)
         current_time = datetime.now().strftime("%H:%M:%S")
         ai_status = check_ai_status()
         
@@ -242,15 +268,7 @@ def render_progress():
     """Render interview progress with stage indicators"""
     try:
         stage = st.session_state.current_stage
-        progress_mapping = {
-            "greeting": 10,
-            "info_collection": 30, 
-            "technical_assessment": 60,
-            "behavioral_assessment": 85,
-            "wrap_up": 100
-        }
-        
-        percentage = progress_mapping.get(stage, 5)
+        percentage = STAGE_PROGRESS_PERCENT.get(stage, 5)
         st.subheader("📊 Interview Progress")
         
         # Enhanced progress bar with color coding
@@ -264,18 +282,10 @@ def render_progress():
         """, unsafe_allow_html=True)
         
         # Stage indicators with enhanced styling
-        stages = [
-            ("👋", "Greeting", "greeting"),
-            ("📝", "Info Collection", "info_collection"),
-            ("💻", "Technical", "technical_assessment"),
-            ("🧠", "Behavioral", "behavioral_assessment"),
-            ("✅", "Complete", "wrap_up")
-        ]
-        
-        for icon, name, stage_key in stages:
+        for icon, name, stage_key in STAGE_INDICATORS:
             if stage_key == stage:
                 st.success(f"{icon} **{name}** (Current)")
-            elif progress_mapping.get(stage_key, 0) < percentage:
+            elif STAGE_PROGRESS_PERCENT.get(stage_key, 0) < percentage:
                 st.success(f"{icon} ✅ {name}")
             else:
                 st.write(f"{icon} ⏳ {name}")
@@ -296,9 +306,8 @@ def render_candidate_info():
         st.subheader("👤 Candidate Profile")
         
         # Calculate profile completeness
-        required_fields = ["name", "email", "experience", "position", "tech_stack"]
-        completed = sum(1 for field in required_fields if candidate_info.get(field))
-        completeness = (completed / len(required_fields)) * 100
+        completed = sum(1 for field in PROFILE_FIELDS if candidate_info.get(field))
+        completeness = (completed / len(PROFILE_FIELDS)) * 100
         
         # Enhanced completeness indicator
         if completeness >= 80:
@@ -309,17 +318,9 @@ def render_candidate_info():
             st.warning(f"📊 Profile: {completeness:.0f}% Complete ⏳")
         
         # Display candidate info with enhanced formatting
-        field_icons = {
-            "name": "👤",
-            "email": "📧",
-            "experience": "⏰",
-            "position": "🎯",
-            "tech_stack": "💻"
-        }
-        
         for key, value in candidate_info.items():
             if value:
-                icon = field_icons.get(key, "📌")
+                icon = PROFILE_FIELD_ICONS.get(key, "📌")
                 st.markdown(f"""
                 <div style='background: #f0f2f6; padding: 0.5rem; border-radius: 5px; margin: 0.3rem 0;'>
                     {icon} <strong>{key.replace('_', ' ').title()}:</strong> {value}
@@ -343,7 +344,6 @@ def render_live_analytics():
         
         # Calculate metrics
         user_messages = [m for m in messages if m.get("role") == "user"]
-        ai_messages = [m for m in messages if m.get("role") == "assistant"]
         
         # Enhanced metrics with AI performance
         col1, col2 = st.columns(2)
@@ -364,12 +364,13 @@ def render_live_analytics():
                 st.metric("📝 Avg Response", "0 chars")
         
         with col2:
-            ai_questions = len([m for m in ai_messages if len(m.get("content", "")) > 50])
+            ai_questions = len(st.session_state.asked_questions)
             st.metric("🤖 AI Questions", ai_questions)
             
             # AI generation rate
-            if st.session_state.interview_start_time:
-                duration = (datetime.now() - st.session_state.interview_start_time).seconds / 60
+            elapsed = interview_elapsed_seconds()
+            if elapsed is not None:
+                duration = elapsed / 60
                 rate = ai_questions / max(duration, 1)
                 st.caption(f"⚡ Generation Rate: {rate:.1f}/min")
                 
@@ -559,8 +560,9 @@ def render_footer():
             st.metric("❓ Questions", question_count)
         
         # Duration with enhanced display
-        if st.session_state.interview_start_time:
-            duration = (datetime.now() - st.session_state.interview_start_time).seconds // 60
+        elapsed = interview_elapsed_seconds()
+        if elapsed is not None:
+            duration = elapsed // 60
             st.metric("⏱️ Duration", f"{duration} min")
             
             # Session efficiency
@@ -583,7 +585,7 @@ def reset_session():
     """Enhanced session reset with AI status preservation"""
     try:
         keys_to_reset = [
-            "conversation_history", "candidate_info", "question_count",
+            "conversation_history", "asked_questions", "candidate_info", "question_count",
             "interview_started", "assessment_scores", "sentiment_history", "ai_response_times"
         ]
         
@@ -596,8 +598,12 @@ def reset_session():
                 else:
                     st.session_state[key] = [] if isinstance(st.session_state[key], list) else {}
         
+        # The chat's archive cache is keyed on the history list's id(), which can be reused
+        st.session_state.pop("archived_markdown", None)
+        
         st.session_state.current_stage = "greeting"
         st.session_state.interview_start_time = datetime.now()
+        st.session_state.interview_start_monotonic = time.monotonic()
         
         # Reset AI error count but preserve status
         st.session_state.ai_error_count = 0
@@ -615,7 +621,7 @@ def export_data():
             "session_info": {
                 "start_time": str(st.session_state.interview_start_time),
                 "current_stage": st.session_state.current_stage,
-                "duration_minutes": (datetime.now() - st.session_state.interview_start_time).seconds // 60 if st.session_state.interview_start_time else 0
+                "duration_minutes": (interview_elapsed_seconds() or 0) // 60
             },
             "candidate_info": st.session_state.candidate_info,
             "conversation_history": st.session_state.conversation_history,
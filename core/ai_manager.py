@@ -4,6 +4,9 @@ Fixed for Streamlit Production Environment
 """
 
 import os
+import hashlib
+import threading
+from cachetools import TTLCache
 from groq import Groq
 from typing import Dict, List, Any, Optional
 import json
@@ -15,6 +18,10 @@ import streamlit as st
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Generated questions are reused for identical interview contexts
+QUESTION_CACHE_SIZE = 256
+QUESTION_CACHE_TTL = 3600
+
 class AdvancedAIManager:
     """AI Manager with Dynamic Question Generation using Llama 3.3 70B - Streamlit Compatible"""
     
@@ -38,6 +45,18 @@ class AdvancedAIManager:
             
         self.current_context = {}
         self.question_history = []
+        self.question_cache = TTLCache(maxsize=QUESTION_CACHE_SIZE, ttl=QUESTION_CACHE_TTL)
+        self.question_cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _question_cache_key(position: Any, experience: Any, skills: List[Any], stage: Any, asked_questions: List[Any]) -> tuple:
+        """Build a hashable signature for a question-generation context
+
+        Context comes from arbitrary request JSON, so every value is reduced to the
+        string the prompt would format it as; lists or dicts never make it unhashable.
+        """
+        asked_key = tuple(hashlib.md5(str(q).encode()).hexdigest()[:8] for q in asked_questions)
+        return (str(position), str(experience), tuple(sorted(map(str, skills))), str(stage), asked_key)
     
     def _make_sync_api_call(self, messages: List[Dict], **kwargs) -> str:
         """Make synchronous API call to Groq"""
@@ -62,6 +81,13 @@ class AdvancedAIManager:
         interview_stage = context.get("stage", "technical")
         asked_questions = context.get("asked_questions", [])
         
+        cache_key = self._question_cache_key(position, experience, skills, interview_stage, asked_questions)
+        with self.question_cache_lock:
+            cached = self.question_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"✅ Reused cached {interview_stage} question")
+            return {**cached, "context": context}
+        
         # Build dynamic system prompt
         system_prompt = f"""You are an expert interviewer conducting a {interview_stage} interview for a {position} position.
 
@@ -117,13 +143,17 @@ Generate ONE exceptional {interview_stage} question now."""
             
             logger.info(f"✅ Generated {interview_stage} question successfully")
             
-            return {
+            result = {
                 "question": question,
                 "type": interview_stage,
                 "model_used": self.model,
                 "success": True,
                 "context": context
             }
+            # Only successful generations are cached; fallbacks retry next time
+            with self.question_cache_lock:
+                self.question_cache[cache_key] = result
+            return result
             
         except Exception as e:
             logger.error(f"Question generation failed: {e}")
@@ -259,6 +289,8 @@ Respond with just the stage name: info_collection/technical_assessment/behaviora
         """Clear question history for new interview"""
         self.question_history = []
         self.current_context = {}
+        with self.question_cache_lock:
+            self.question_cache.clear()
 
 # Global instance with error handling
 try:
@@ -1,4 +1,5 @@
 import logging
+import re
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -11,6 +12,9 @@ from .persona_manager import PersonaManager
 
 logger = logging.getLogger(__name__)
 
+# Whole-answer email check: one address, no whitespace, a dot in the domain
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
 class ConversationState(str, Enum):
     """Conversation state management"""
     INITIALIZED = "initialized"
@@ -93,6 +97,15 @@ class ConversationEngine:
                 "Excellent problem-solving approach."
             ]
         }
+        
+        # Stage input handlers, dispatched by a single lookup per turn
+        self.stage_handlers = {
+            InterviewStage.GREETING: self._process_greeting_stage,
+            InterviewStage.INFO_COLLECTION: self._process_info_collection_stage,
+            InterviewStage.TECHNICAL_ASSESSMENT: self._process_technical_stage,
+            InterviewStage.BEHAVIORAL_ASSESSMENT: self._process_behavioral_stage,
+            InterviewStage.WRAP_UP: self._process_wrap_up_stage
+        }
     
     def initialize_conversation(self, session_id: str) -> ConversationContext:
         """Initialize new conversation context"""
@@ -174,20 +187,10 @@ class ConversationEngine:
     def _process_stage_specific_input(self, context: ConversationContext, user_input: str) -> str:
         """Process input based on current interview stage"""
         
-        stage = context.current_stage
-        
-        if stage == InterviewStage.GREETING:
-            return self._process_greeting_stage(context, user_input)
-        elif stage == InterviewStage.INFO_COLLECTION:
-            return self._process_info_collection_stage(context, user_input)
-        elif stage == InterviewStage.TECHNICAL_ASSESSMENT:
-            return self._process_technical_stage(context, user_input)
-        elif stage == InterviewStage.BEHAVIORAL_ASSESSMENT:
-            return self._process_behavioral_stage(context, user_input)
-        elif stage == InterviewStage.WRAP_UP:
-            return self._process_wrap_up_stage(context, user_input)
-        else:
+        handler = self.stage_handlers.get(context.current_stage)
+        if handler is None:
             return "Thank you for your response. Let's continue our conversation."
+        return handler(context, user_input)
     
     def _process_greeting_stage(self, context: ConversationContext, user_input: str) -> str:
         """Process greeting stage input"""
@@ -209,20 +212,21 @@ Could you please share your **email address** so we can keep in touch?"""
         """Process information collection stage"""
         
         candidate_data = context.candidate_data
+        answer = user_input.strip()
         
         if "email" not in candidate_data:
-            if "@" in user_input and "." in user_input:
-                candidate_data["email"] = user_input.strip()
+            if EMAIL_PATTERN.match(answer):
+                candidate_data["email"] = answer
                 return "Perfect! Now, **how many years of professional experience** do you have?"
             else:
                 return "Please provide a valid email address (e.g., john@example.com)"
         
         elif "experience" not in candidate_data:
-            candidate_data["experience"] = user_input.strip()
+            candidate_data["experience"] = answer
             return "Great! **What type of position** are you interested in? (e.g., Software Engineer, Data Scientist, Product Manager)"
         
         elif "position" not in candidate_data:
-            candidate_data["position"] = user_input.strip()
+            candidate_data["position"] = answer
             return """Excellent! Now for the key part - **what programming languages, frameworks, and technologies** are you proficient with?
 
 Please list your main technical skills separated by commas (e.g., Python, React, AWS, PostgreSQL)"""
@@ -344,7 +348,8 @@ Have a wonderful day, and thank you for your interest in our company! 🚀"""
     def _generate_encouragement_feedback(self, response: str) -> str:
         """Generate encouraging feedback based on response quality"""
         
-        response_length = len(response.split())
+        # Only the bucket matters, so stop splitting once past the top threshold
+        response_length = len(response.split(None, 80))
         
         if response_length > 80:
             return "**Excellent!** I appreciate the comprehensive explanation and the depth of detail you provided."
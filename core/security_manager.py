@@ -17,6 +17,19 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import instead of on every check
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+QUOTE_PATTERN = re.compile(r'[\'";]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+EMAIL_FORMAT_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+REPEATED_CHAR_PATTERN = re.compile(r'(.)\1{5,}')
+RANDOM_SEQUENCE_PATTERN = re.compile(r'[a-zA-Z]{20,}[0-9]{10,}')
+INAPPROPRIATE_PATTERNS = [
+    re.compile(r'\b(hate|violence|harassment)\b', re.IGNORECASE),
+    re.compile(r'\b(personal|private|confidential)\s+information\b', re.IGNORECASE),
+    re.compile(r'\b(password|credit card|ssn|social security)\b', re.IGNORECASE)
+]
+
 @dataclass
 class SecurityEvent:
     """Security event for logging and monitoring"""
@@ -235,13 +248,13 @@ class SecurityManager:
             return ""
         
         # Remove potential HTML/script tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = HTML_TAG_PATTERN.sub('', text)
         
         # Remove potential SQL injection patterns
-        text = re.sub(r'[\'";]', '', text)
+        text = QUOTE_PATTERN.sub('', text)
         
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_PATTERN.sub(' ', text)
         
         # Remove control characters
         text = ''.join(char for char in text if ord(char) >= 32 or char in '\n\r\t')
@@ -303,14 +316,8 @@ class SecurityManager:
         violations = []
         
         # Check for inappropriate content
-        inappropriate_patterns = [
-            r'\b(hate|violence|harassment)\b',
-            r'\b(personal|private|confidential)\s+information\b',
-            r'\b(password|credit card|ssn|social security)\b'
-        ]
-        
-        for pattern in inappropriate_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in INAPPROPRIATE_PATTERNS:
+            if pattern.search(text):
                 violations.append("Content may violate community guidelines")
                 break
         
@@ -379,14 +386,13 @@ class SecurityManager:
     
     def _validate_email_format(self, email: str) -> bool:
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(EMAIL_FORMAT_PATTERN.match(email))
     
     def _has_excessive_repetition(self, text: str) -> bool:
         """Check for excessive character or word repetition"""
         
         # Character repetition (more than 5 consecutive same characters)
-        if re.search(r'(.)\1{5,}', text):
+        if REPEATED_CHAR_PATTERN.search(text):
             return True
         
         # Word repetition (same word more than 3 times)
@@ -411,7 +417,7 @@ class SecurityManager:
             return True
         
         # Random character sequences
-        if re.search(r'[a-zA-Z]{20,}[0-9]{10,}', text):
+        if RANDOM_SEQUENCE_PATTERN.search(text):
             return True
         
         return False
@@ -11,7 +11,7 @@ import time
 
 # Import components
 from components.sidebar import render_sidebar
-from components.advanced_chat import render_chat_interface
+from components.advanced_chat import render_chat_interface, interview_elapsed_seconds
 
 # Load environment variables
 load_dotenv()
@@ -102,6 +102,7 @@ def initialize_session_state():
         'current_stage': 'greeting',
         'candidate_info': {},
         'question_count': 0,
+        'asked_questions': [],
         'interview_started': False,
         'interview_start_time': None,
         'ai_status': 'Checking...',
@@ -213,9 +214,7 @@ def render_interview_analytics():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_duration = 0
-        if st.session_state.interview_start_time:
-            total_duration = (datetime.now() - st.session_state.interview_start_time).seconds // 60
+        total_duration = (interview_elapsed_seconds() or 0) // 60
         st.metric("⏱️ Interview Duration", f"{total_duration} minutes")
     
     with col2:
@@ -336,16 +335,17 @@ def calculate_engagement_score():
     engagement = min(100, (avg_length / 100) * 100)
     return round(engagement, 1)
 
+STAGE_COMPLETION = {
+    'greeting': 20,
+    'info_collection': 40,
+    'technical_assessment': 70,
+    'behavioral_assessment': 90,
+    'wrap_up': 100
+}
+
 def calculate_interview_completion():
     """Calculate interview completion percentage"""
-    stage_progress = {
-        'greeting': 20,
-        'info_collection': 40,
-        'technical_assessment': 70,
-        'behavioral_assessment': 90,
-        'wrap_up': 100
-    }
-    return stage_progress.get(st.session_state.current_stage, 10)
+    return STAGE_COMPLETION.get(st.session_state.current_stage, 10)
 
 def main():
     """Enhanced main application"""
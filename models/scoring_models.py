@@ -73,7 +73,8 @@ class CandidateScorer:
             score_factors.append(min(0.4, len(tech_terms) * 0.1))
         
         # Response length and structure
-        word_count = len(response.split())
+        # Capped split: counts beyond the top threshold are never needed
+        word_count = len(response.split(None, 100))
         if word_count > 100:
             evidence.append("Provided detailed explanation")
             score_factors.append(0.2)
@@ -147,7 +148,7 @@ class CandidateScorer:
             score_factors.append(0.2)
         
         # Completeness
-        if len(response.split()) > 50:
+        if len(response.split(None, 50)) > 50:
             evidence.append("Comprehensive response")
             score_factors.append(0.2)
         
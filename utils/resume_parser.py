@@ -12,6 +12,53 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+def compile_keyword_pattern(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile fixed substrings into one pattern that finds every occurrence in a single pass
+    
+    The lookahead lets overlapping keywords (e.g. "senior software engineer"
+    and "software engineer") all be reported, matching plain substring checks.
+    """
+    alternatives = '|'.join(map(re.escape, sorted(keywords, key=len, reverse=True)))
+    return re.compile(f'(?=({alternatives}))')
+
+# Patterns compiled once at import instead of on every parse call
+NAME_LINE_PATTERN = re.compile(r'^[A-Za-z\s\.]+$')
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERNS = [
+    re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),  # US format
+    re.compile(r'\b\+?1[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'),  # US with country code
+    re.compile(r'\b\+?\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}\b')  # International
+]
+SKILL_SECTION_PATTERNS = [
+    re.compile(r'(?:skills?|technologies?|tools?)[\s:]*([^\n]+)', re.IGNORECASE),
+    re.compile(r'(?:programming|technical)\s+(?:languages?|skills?)[\s:]*([^\n]+)', re.IGNORECASE),
+    re.compile(r'(?:proficient|experienced)\s+(?:in|with)[\s:]*([^\n]+)', re.IGNORECASE)
+]
+LIST_SEPARATOR_PATTERN = re.compile(r'[,;|\n•·]')
+DEGREE_PATTERNS = [
+    re.compile(r'(bachelor[\'s]?\s+(?:of\s+)?(?:science|arts|engineering|technology|computer science))'),
+    re.compile(r'(master[\'s]?\s+(?:of\s+)?(?:science|arts|engineering|technology|business administration))'),
+    re.compile(r'(phd|doctorate)\s+(?:in\s+)?(\w+)'),
+    re.compile(r'(diploma)\s+(?:in\s+)?(\w+)'),
+    re.compile(r'(certificate)\s+(?:in\s+)?(\w+)')
+]
+TITLE_PATTERNS = [
+    re.compile(r'(?:worked as|served as|position as)\s+([a-zA-Z\s]+)', re.IGNORECASE),
+    re.compile(r'(?:role|title)[\s:]+([a-zA-Z\s]+)', re.IGNORECASE),
+    re.compile(r'(?:current|previous)\s+(?:role|position)[\s:]+([a-zA-Z\s]+)', re.IGNORECASE)
+]
+CERT_KEYWORDS = [
+    'aws certified', 'azure certified', 'google cloud certified',
+    'cisco certified', 'microsoft certified', 'oracle certified',
+    'certified scrum master', 'pmp', 'cissp', 'ceh', 'comptia',
+    'salesforce certified', 'red hat certified'
+]
+CERT_KEYWORD_PATTERN = compile_keyword_pattern(CERT_KEYWORDS)
+CERT_SECTION_PATTERNS = [
+    re.compile(r'(?:certifications?|certificates?)[\s:]*([^\n]+)', re.IGNORECASE),
+    re.compile(r'(?:certified|licensed)\s+(?:in|as)[\s:]*([^\n]+)', re.IGNORECASE)
+]
+
 @dataclass
 class ParsedResume:
     """Structured resume data"""
@@ -78,6 +125,28 @@ class ResumeParser:
             'product manager', 'business analyst', 'qa engineer', 'tester',
             'ui/ux designer', 'product designer', 'scrum master', 'architect'
         ]
+        
+        # Fold each pattern list into one alternation so a single regex pass
+        # replaces a Python loop of searches; longest skills go first so
+        # multi-word names win over their prefixes. The experience union is a
+        # lookahead so every start position is tried and no alternative's
+        # match is hidden inside another's
+        self.experience_pattern = re.compile(
+            '(?=' + '|'.join(f'(?:{pattern})' for pattern in self.experience_patterns) + ')'
+        )
+        all_skills = sorted(
+            {skill.lower() for skills in self.tech_skills.values() for skill in skills},
+            key=len, reverse=True
+        )
+        self.skill_pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, all_skills)) + r')\b')
+        
+        self.job_title_pattern = compile_keyword_pattern(self.job_title_patterns)
+        
+        # Skill -> categories lookup for O(1) membership checks
+        self.skill_categories: Dict[str, Tuple[str, ...]] = {}
+        for category, skills in self.tech_skills.items():
+            for skill in skills:
+                self.skill_categories[skill] = self.skill_categories.get(skill, ()) + (category,)
     
     def parse_resume_text(self, text: str) -> ParsedResume:
         """Parse resume text and extract structured data"""
@@ -133,7 +202,7 @@ class ResumeParser:
             line = line.strip()
             if 2 <= len(line.split()) <= 4:
                 # Check if it looks like a name (only letters, spaces, dots)
-                if re.match(r'^[A-Za-z\s\.]+$', line) and not any(
+                if NAME_LINE_PATTERN.match(line) and not any(
                     keyword in line.lower() for keyword in ['email', 'phone', 'address', 'resume']
                 ):
                     return line.title()
@@ -141,20 +210,15 @@ class ResumeParser:
     
     def _extract_email(self, text: str) -> str:
         """Extract email address"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return emails[0] if emails else ""
+        if '@' not in text:
+            return ""
+        email_match = EMAIL_PATTERN.search(text)
+        return email_match.group() if email_match else ""
     
     def _extract_phone(self, text: str) -> str:
         """Extract phone number"""
-        phone_patterns = [
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # US format
-            r'\b\+?1[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',  # US with country code
-            r'\b\+?\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}\b'  # International
-        ]
-        
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
+        for pattern in PHONE_PATTERNS:
+            phones = pattern.findall(text)
             if phones:
                 return phones[0]
         return ""
@@ -162,51 +226,41 @@ class ResumeParser:
     def _extract_skills(self, text: str) -> List[str]:
         """Extract technical skills using comprehensive matching"""
         text_lower = text.lower()
-        found_skills = []
         
-        # Check each skill category
-        for category, skills in self.tech_skills.items():
-            for skill in skills:
-                # Use word boundaries to avoid partial matches
-                pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_skills.append(skill.title())
+        # Find every known skill in one pass, using word boundaries to avoid partial matches
+        found_skills = [skill.title() for skill in dict.fromkeys(self.skill_pattern.findall(text_lower))]
         
         # Additional pattern matching for common skill formats
-        skill_section_patterns = [
-            r'(?:skills?|technologies?|tools?)[\s:]*([^\n]+)',
-            r'(?:programming|technical)\s+(?:languages?|skills?)[\s:]*([^\n]+)',
-            r'(?:proficient|experienced)\s+(?:in|with)[\s:]*([^\n]+)'
-        ]
-        
-        for pattern in skill_section_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        seen_skills = set(found_skills)
+        for pattern in SKILL_SECTION_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 # Split by common separators and clean
-                potential_skills = re.split(r'[,;|\n•·]', match)
+                potential_skills = LIST_SEPARATOR_PATTERN.split(match)
                 for skill in potential_skills:
                     skill = skill.strip().title()
-                    if 2 <= len(skill) <= 30 and skill not in found_skills:
-                        # Check if it's a known technology
-                        if any(skill.lower() in category_skills 
-                              for category_skills in self.tech_skills.values()):
-                            found_skills.append(skill)
-        
-        # Remove duplicates and sort
-        return sorted(list(set(found_skills)))
+                    # Keep it only if it's a known technology
+                    if 2 <= len(skill) <= 30 and skill not in seen_skills and skill.lower() in self.skill_categories:
+                        seen_skills.add(skill)
+        
+        return sorted(seen_skills)
     
     def _extract_experience_years(self, text: str) -> int:
         """Extract years of professional experience"""
         text_lower = text.lower()
         
-        for pattern in self.experience_patterns:
-            matches = re.findall(pattern, text_lower)
-            if matches:
-                try:
-                    years = max(int(match.replace('+', '')) for match in matches)
-                    return min(years, 50)  # Cap at reasonable maximum
-                except ValueError:
-                    continue
+        # Each alternative captures its own group, so lastindex names the pattern;
+        # the earliest pattern with any hit wins, as when they were tried in order
+        hits = {}
+        for match in self.experience_pattern.finditer(text_lower):
+            hits.setdefault(match.lastindex, []).append(match.group(match.lastindex))
+        if hits:
+            matches = hits[min(hits)]
+            try:
+                years = max(int(match.replace('+', '')) for match in matches)
+                return min(years, 50)  # Cap at reasonable maximum
+            except ValueError:
+                pass
         
         return 0
     
@@ -216,16 +270,8 @@ class ResumeParser:
         education = []
         
         # Look for degree patterns
-        degree_patterns = [
-            r'(bachelor[\'s]?\s+(?:of\s+)?(?:science|arts|engineering|technology|computer science))',
-            r'(master[\'s]?\s+(?:of\s+)?(?:science|arts|engineering|technology|business administration))',
-            r'(phd|doctorate)\s+(?:in\s+)?(\w+)',
-            r'(diploma)\s+(?:in\s+)?(\w+)',
-            r'(certificate)\s+(?:in\s+)?(\w+)'
-        ]
-        
-        for pattern in degree_patterns:
-            matches = re.findall(pattern, text_lower)
+        for pattern in DEGREE_PATTERNS:
+            matches = pattern.findall(text_lower)
             for match in matches:
                 if isinstance(match, tuple):
                     degree_text = ' '.join(filter(None, match))
@@ -233,65 +279,40 @@ class ResumeParser:
                     degree_text = match
                 education.append(degree_text.title())
         
-        return list(set(education))
+        return list(dict.fromkeys(education))
     
     def _extract_job_titles(self, text: str) -> List[str]:
         """Extract previous job titles"""
         text_lower = text.lower()
-        found_titles = []
-        
-        for title in self.job_title_patterns:
-            if title in text_lower:
-                found_titles.append(title.title())
+        found_titles = [title.title() for title in dict.fromkeys(self.job_title_pattern.findall(text_lower))]
         
         # Look for common job title patterns
-        title_patterns = [
-            r'(?:worked as|served as|position as)\s+([a-zA-Z\s]+)',
-            r'(?:role|title)[\s:]+([a-zA-Z\s]+)',
-            r'(?:current|previous)\s+(?:role|position)[\s:]+([a-zA-Z\s]+)'
-        ]
-        
-        for pattern in title_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in TITLE_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 title = match.strip().title()
                 if 5 <= len(title) <= 50 and title not in found_titles:
                     found_titles.append(title)
         
-        return list(set(found_titles))
+        return found_titles
     
     def _extract_certifications(self, text: str) -> List[str]:
         """Extract professional certifications"""
-        cert_keywords = [
-            'aws certified', 'azure certified', 'google cloud certified',
-            'cisco certified', 'microsoft certified', 'oracle certified',
-            'certified scrum master', 'pmp', 'cissp', 'ceh', 'comptia',
-            'salesforce certified', 'red hat certified'
-        ]
-        
         text_lower = text.lower()
-        certifications = []
-        
-        for cert in cert_keywords:
-            if cert in text_lower:
-                certifications.append(cert.title())
+        certifications = [cert.title() for cert in dict.fromkeys(CERT_KEYWORD_PATTERN.findall(text_lower))]
         
         # Look for certification section
-        cert_patterns = [
-            r'(?:certifications?|certificates?)[\s:]*([^\n]+)',
-            r'(?:certified|licensed)\s+(?:in|as)[\s:]*([^\n]+)'
-        ]
-        
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in CERT_SECTION_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
-                cert_items = re.split(r'[,;|\n•·]', match)
+                cert_items = LIST_SEPARATOR_PATTERN.split(match)
                 for item in cert_items:
                     item = item.strip().title()
                     if 5 <= len(item) <= 100:
                         certifications.append(item)
         
-        return list(set(certifications))
+        # Order-preserving dedup keeps results stable across runs
+        return list(dict.fromkeys(certifications))
     
     def _generate_summary(self, resume: ParsedResume) -> str:
         """Generate professional summary based on extracted data"""
@@ -348,12 +369,9 @@ class ResumeParser:
         if not skills:
             return categories
         
-        skills_lower = [skill.lower() for skill in skills]
-        
-        for category, category_skills in self.tech_skills.items():
-            for skill in category_skills:
-                if skill in skills_lower:
-                    categories[category] += 1
+        for skill in {skill.lower() for skill in skills}:
+            for category in self.skill_categories.get(skill, ()):
+                categories[category] += 1
         
         return categories
     
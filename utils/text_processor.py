@@ -115,9 +115,10 @@ class TextProcessor:
                 total_tech_terms += len(found_terms)
         
         # Calculate text metrics
-        word_count = len(text.split())
-        unique_words = len(set(text.lower().split()))
-        avg_word_length = sum(len(word) for word in text.split()) / max(word_count, 1)
+        words = text.split()
+        word_count = len(words)
+        unique_words = len(set(text_lower.split()))
+        avg_word_length = sum(map(len, words)) / max(word_count, 1)
         sentence_count = len(self.split_sentences(text))
         avg_sentence_length = word_count / max(sentence_count, 1)
         
@@ -8,6 +8,12 @@ from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import instead of on every call
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+SKILL_SEPARATOR_PATTERN = re.compile(r'[,;|\n]+')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
 class InputValidator:
     """Advanced input validation for chat interface"""
     
@@ -19,6 +25,7 @@ class InputValidator:
             r'javascript:',              # JavaScript protocols
             r'on\w+\s*=',               # Event handlers
         ]
+        self.compiled_blocked_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.blocked_patterns]
     
     def validate_text_input(self, text: str) -> Dict[str, Any]:
         """Validate text input with comprehensive checks"""
@@ -38,8 +45,8 @@ class InputValidator:
             errors.append(f"Input too long (maximum {self.max_length} characters)")
         
         # Security checks
-        for pattern in self.blocked_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in self.compiled_blocked_patterns:
+            if pattern.search(text):
                 errors.append("Input contains potentially harmful content")
                 break
         
@@ -56,8 +63,7 @@ class InputValidator:
     
     def validate_email(self, email: str) -> bool:
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(EMAIL_PATTERN.match(email))
     
     def validate_tech_stack(self, tech_stack: str) -> List[str]:
         """Validate and clean tech stack input"""
@@ -65,7 +71,7 @@ class InputValidator:
             return []
         
         # Split by common separators
-        skills = re.split(r'[,;|\n]+', tech_stack)
+        skills = SKILL_SEPARATOR_PATTERN.split(tech_stack)
         
         # Clean and filter
         cleaned_skills = []
@@ -88,10 +94,10 @@ def sanitize_input(text: str) -> str:
         return ""
     
     # Remove potential HTML/script tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = HTML_TAG_PATTERN.sub('', text)
     
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_PATTERN.sub(' ', text)
     
     # Trim and return
     return text.strip()